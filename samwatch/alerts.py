@@ -2,26 +2,93 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import smtplib
+import sqlite3
+import sys
+import threading
 import time
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from email.message import EmailMessage
+from functools import cached_property, lru_cache
 from string import Template
-from typing import Any
-
-import httpx
-from rich.console import Console
-from rich.table import Table
+from typing import TYPE_CHECKING, Any
 
 from .config import Config
-from .db import Database
+from .db import Database, in_clause
+
+if TYPE_CHECKING:
+    import httpx
+    from rich.console import Console
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _webhook_body(payload: Mapping[str, Any]) -> bytes:
+    """Serialize a webhook payload, with orjson when it is installed.
+
+    Only used for request bodies: stored payload JSON keeps the stdlib encoding so
+    payload hashes, and therefore re-notification, don't depend on orjson being present.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, default=str)
+    return json.dumps(payload, default=str).encode()
+
+
+# Keep bound parameters per statement below SQLite's historical 999 limit. A multiple
+# of 16 so full chunks need no in_clause padding.
+_MAX_SQL_PARAMETERS = 896
+_MAX_DELIVERY_WORKERS = 16
+_NOTICE_URL_PREFIX = "https://sam.gov/opp/"
+
+
+@lru_cache(maxsize=512)
+def _parse_json_cached(raw: str) -> Any:
+    """Parse a rule definition or alert target, memoized on the raw text.
+
+    The parsed value is shared between callers and must be treated as read-only.
+    """
+
+    return json.loads(raw)
+
+
+# Columns a JSON rule term may filter on. Field names are interpolated into SQL,
+# so anything outside this set is rejected at compile time.
+_JSON_RULE_FIELDS = frozenset(
+    {
+        "notice_id",
+        "title",
+        "agency",
+        "sub_tier",
+        "office",
+        "notice_type",
+        "status",
+        "posted_at",
+        "updated_at",
+        "response_deadline",
+        "naics_codes",
+        "set_aside",
+    }
+)
+
+# Fields mirrored into the trigram ``opportunities_fts`` index. Trigram matching is
+# equivalent to ``LIKE '%value%'`` but needs at least three characters per value.
+_FTS_RULE_FIELDS = _JSON_RULE_FIELDS - {"posted_at", "updated_at", "response_deadline"}
+_FTS_MIN_TERM_LENGTH = 3
+# Escapes LIKE's wildcards so the fallback is a literal substring match, like trigram MATCH.
+_LIKE_ESCAPES = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+
 @dataclass(slots=True)
 class AlertDestination:
     """Configuration for delivering notifications."""
@@ -39,16 +106,114 @@ class MatchRecord:
     payload: Mapping[str, Any] | None = None
 
 
+@dataclass(slots=True)
+class CompiledRule:
+    """A rule definition translated into a ready-to-bind SQL statement."""
+
+    kind: str
+    source: str
+    sql: str
+    parameters: tuple[object, ...] = ()
+
+
 class AlertEngine:
     """Evaluate pursuit rules against the database and persist matches."""
 
     def __init__(self, config: Config, database: Database) -> None:
         self.config = config
         self.database = database
-        self._console = Console()
+        self._rule_cache: dict[int, CompiledRule] = {}
+        self._rule_names: dict[int, str] = {}
+        self._destinations: dict[int, list[AlertDestination]] = {}
+        self._registry_version: int | None = None
+        # Created on the first webhook delivery; importing httpx is a large share of
+        # this module's import cost and many engines only deliver email or CLI alerts.
+        self._http: httpx.Client | None = None
+        self._http_lock = threading.Lock()
+        self._smtp_connections: dict[tuple[str, int, str | None, bool], smtplib.SMTP] = {}
+        self._smtp_lock = threading.Lock()
+        # Each rule worker's read-only connection, set by _open_rule_reader.
+        self._rule_reader = threading.local()
 
     def evaluate_rules(self) -> None:
-        """Run all active rules and persist their matches."""
+        """Run all active rules and persist their matches.
+
+        Rule queries run concurrently on a thread pool, each worker opening one read-only
+        connection for the whole pass. Once every query has finished, the matches are
+        persisted on the calling thread in one transaction, so the write lock is only
+        held for the writes themselves.
+        """
+
+        self._refresh_registry()
+        if not self._rule_cache:
+            return
+
+        results: list[tuple[int, list[sqlite3.Row]]] = []
+        workers = max(1, min(self.config.rule_workers, len(self._rule_cache)))
+        readers: list[sqlite3.Connection] = []
+        readers_lock = threading.Lock()
+        try:
+            with ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix="samwatch-rule",
+                initializer=self._open_rule_reader,
+                initargs=(readers, readers_lock),
+            ) as pool:
+                futures = {
+                    pool.submit(self._evaluate_rule, compiled): rule_id
+                    for rule_id, compiled in self._rule_cache.items()
+                }
+                for future in as_completed(futures):
+                    rule_id = futures[future]
+                    try:
+                        results.append((rule_id, future.result()))
+                    except Exception as exc:  # pragma: no cover - defensive logging
+                        logger.exception("Failed to evaluate rule %s: %s", rule_id, exc)
+        finally:
+            # The pool has shut down, so no worker is still using its connection.
+            for conn in readers:
+                conn.close()
+
+        pending: list[tuple[int, str, list[MatchRecord]]] = []
+        # All matches from this pass commit together; notifications go out only after
+        # the commit so a failed pass never alerts on rows that were rolled back.
+        with self.database.transaction() as cur:
+            for rule_id, matches in results:
+                rule_name = self._rule_names[rule_id]
+                new_matches = self._persist_matches(cur, rule_id, matches)
+                if not new_matches:
+                    logger.debug("Rule %s produced no new matches", rule_name)
+                    continue
+
+                logger.info("Rule %s produced %d new matches", rule_name, len(new_matches))
+                pending.append((rule_id, rule_name, new_matches))
+
+        if not pending:
+            return
+        summaries = self._load_opportunity_summaries(
+            [
+                match.opportunity_id
+                for rule_id, _, new_matches in pending
+                if rule_id in self._destinations
+                for match in new_matches
+            ]
+        )
+        for rule_id, rule_name, new_matches in pending:
+            self._dispatch_notifications(
+                rule_name, new_matches, self._destinations.get(rule_id, []), summaries
+            )
+
+    def _refresh_registry(self) -> None:
+        """Reload active rules and their destinations if either table has changed.
+
+        Triggers on ``rules`` and ``alerts`` bump ``rule_registry.version``, so a
+        long-running daemon only re-reads and recompiles rules after an edit.
+        """
+
+        row = self.database.execute("SELECT version FROM rule_registry WHERE id = 1").fetchone()
+        version = row[0] if row is not None else None
+        if version is not None and version == self._registry_version:
+            return
 
         with self.database.cursor() as cur:
             cur.execute(
@@ -56,111 +221,176 @@ class AlertEngine:
             )
             rules = cur.fetchall()
 
+        compiled_rules: dict[int, CompiledRule] = {}
+        rule_names: dict[int, str] = {}
         for rule in rules:
-            rule_id = rule[0]
-            rule_name = rule[1]
-            kind = rule[2]
-            definition = rule[3]
+            if rule[2] not in {"sql", "json"}:
+                logger.warning("Unknown rule kind %s", rule[2])
+                continue
             try:
-                if kind == "sql":
-                    matches = self._execute_sql(definition)
-                elif kind == "json":
-                    matches = self._execute_json_rule(definition)
-                else:
-                    logger.warning("Unknown rule kind %s", kind)
-                    continue
+                compiled_rules[rule[0]] = self._compiled_rule(rule[0], rule[2], rule[3])
             except Exception as exc:  # pragma: no cover - defensive logging
-                logger.exception("Failed to evaluate rule %s: %s", rule_id, exc)
-                continue
-
-            new_matches = self._persist_matches(rule_id, matches)
-            if not new_matches:
-                logger.debug("Rule %s produced no new matches", rule_name)
+                logger.exception("Failed to evaluate rule %s: %s", rule[0], exc)
                 continue
-
-            logger.info(
-                "Rule %s produced %d new matches", rule_name, len(new_matches)
-            )
-            self._dispatch_notifications(rule_id, rule_name, new_matches)
-
-    def _execute_sql(self, statement: str) -> Iterable[Mapping[str, object]]:
-        cur = self.database.execute(statement)
-        rows = cur.fetchall()
-        return [dict(row) for row in rows]
-
-    def _execute_json_rule(self, definition: str) -> Iterable[Mapping[str, object]]:
-        payload = json.loads(definition)
-        terms = payload.get("terms", [])
-        sql = "SELECT id AS opportunity_id FROM opportunities WHERE 1=1"
-        parameters: list[object] = []
-        for term in terms:
+            rule_names[rule[0]] = rule[1]
+        self._rule_cache = compiled_rules
+        self._rule_names = rule_names
+        self._destinations = self._load_destinations(list(compiled_rules))
+        self._registry_version = version
+
+    def _compiled_rule(self, rule_id: int, kind: str, definition: str) -> CompiledRule:
+        """Return the compiled form of a rule, recompiling only when it changed."""
+
+        cached = self._rule_cache.get(rule_id)
+        if cached is not None and cached.kind == kind and cached.source == definition:
+            return cached
+        return self._compile_rule(kind, definition)
+
+    def _compile_rule(self, kind: str, definition: str) -> CompiledRule:
+        if kind == "sql":
+            return CompiledRule(kind=kind, source=definition, sql=definition)
+
+        payload = _parse_json_cached(definition)
+        terms: list[tuple[str, str]] = []
+        for term in payload.get("terms", []):
             field = term.get("field")
             value = term.get("value")
             if not field or value is None:
                 continue
-            sql += f" AND {field} LIKE ?"
-            parameters.append(f"%{value}%")
-        cur = self.database.execute(sql, parameters)
-        rows = cur.fetchall()
-        return [dict(row) for row in rows]
+            if field not in _JSON_RULE_FIELDS:
+                raise ValueError(f"Unsupported JSON rule field: {field}")
+            terms.append((field, str(value)))
+
+        if terms and all(
+            field in _FTS_RULE_FIELDS and len(value) >= _FTS_MIN_TERM_LENGTH
+            for field, value in terms
+        ):
+            query = " AND ".join(
+                f'{field} : "{value.replace(chr(34), chr(34) * 2)}"' for field, value in terms
+            )
+            return CompiledRule(
+                kind=kind,
+                source=definition,
+                sql=(
+                    "SELECT rowid AS opportunity_id FROM opportunities_fts "
+                    "WHERE opportunities_fts MATCH ?"
+                ),
+                parameters=(query,),
+            )
+
+        clauses = "".join(f" AND {field} LIKE ? ESCAPE '\\'" for field, _ in terms)
+        return CompiledRule(
+            kind=kind,
+            source=definition,
+            sql=f"SELECT id AS opportunity_id FROM opportunities WHERE 1=1{clauses}",
+            parameters=tuple(f"%{value.translate(_LIKE_ESCAPES)}%" for _, value in terms),
+        )
+
+    def _open_rule_reader(
+        self, readers: list[sqlite3.Connection], lock: threading.Lock
+    ) -> None:
+        """Pool initializer: give this worker thread its own read-only connection."""
+
+        conn = self.database.open_reader()
+        with lock:
+            readers.append(conn)
+        self._rule_reader.connection = conn
+
+    def _evaluate_rule(self, rule: CompiledRule) -> list[sqlite3.Row]:
+        """Execute a compiled rule on a worker thread."""
+
+        return self._rule_reader.connection.execute(rule.sql, rule.parameters).fetchall()
 
     def _persist_matches(
-        self, rule_id: int, matches: Iterable[Mapping[str, object]]
+        self, cur: sqlite3.Cursor, rule_id: int, matches: Sequence[sqlite3.Row]
     ) -> list[MatchRecord]:
-        new_matches: list[MatchRecord] = []
-        with self.database.cursor() as cur:
-            for match in matches:
-                if not isinstance(match, Mapping):
-                    continue
-                opportunity_id = match.get("opportunity_id")
-                if opportunity_id is None:
-                    continue
-                try:
-                    opportunity_id_int = int(opportunity_id)
-                except (TypeError, ValueError):
-                    logger.debug(
-                        "Skipping match with non-integer opportunity_id: %s",
-                        opportunity_id,
-                    )
-                    continue
-                payload = {
-                    key: value
-                    for key, value in match.items()
-                    if key != "opportunity_id"
-                }
-                payload_json = json.dumps(payload, default=str) if payload else None
-                cur.execute(
-                    "SELECT 1 FROM rule_matches WHERE rule_id = ? AND opportunity_id = ?",
-                    (rule_id, opportunity_id_int),
-                )
-                existed = cur.fetchone() is not None
-                cur.execute(
-                    """
-                    INSERT INTO rule_matches (rule_id, opportunity_id, payload)
-                    VALUES (?, ?, ?)
-                    ON CONFLICT(rule_id, opportunity_id) DO UPDATE
-                        SET matched_at = CURRENT_TIMESTAMP,
-                            payload = COALESCE(excluded.payload, payload)
-                    """,
-                    (rule_id, opportunity_id_int, payload_json),
+        if not matches:
+            return []
+        columns = matches[0].keys()
+        if "opportunity_id" not in columns:
+            logger.debug("Rule %s returned rows without an opportunity_id column", rule_id)
+            return []
+        id_index = columns.index("opportunity_id")
+        payload_columns = [
+            (index, column) for index, column in enumerate(columns) if index != id_index
+        ]
+
+        rows: dict[int, tuple[str | None, str | None, Mapping[str, Any] | None]] = {}
+        for match in matches:
+            opportunity_id = match[id_index]
+            if opportunity_id is None:
+                continue
+            try:
+                opportunity_id_int = int(opportunity_id)
+            except (TypeError, ValueError):
+                logger.debug(
+                    "Skipping match with non-integer opportunity_id: %s",
+                    opportunity_id,
                 )
-                if not existed:
-                    new_matches.append(MatchRecord(opportunity_id_int, payload or None))
-        return new_matches
+                continue
+            payload = {column: match[index] for index, column in payload_columns}
+            payload_json = json.dumps(payload, default=str) if payload else None
+            payload_hash = (
+                hashlib.blake2b(payload_json.encode(), digest_size=16).hexdigest()
+                if payload_json
+                else None
+            )
+            rows[opportunity_id_int] = (payload_json, payload_hash, payload or None)
+        if not rows:
+            return []
+
+        opportunity_ids = list(rows)
+        existing: dict[int, str | None] = {}
+        for start in range(0, len(opportunity_ids), _MAX_SQL_PARAMETERS):
+            chunk = opportunity_ids[start : start + _MAX_SQL_PARAMETERS]
+            placeholders, parameters = in_clause(chunk)
+            cur.execute(
+                f"""
+                SELECT opportunity_id, payload_hash FROM rule_matches
+                WHERE rule_id = ? AND opportunity_id IN ({placeholders})
+                """,
+                (rule_id, *parameters),
+            )
+            existing.update((row[0], row[1]) for row in cur.fetchall())
+        # Unchanged payloads are bound as NULL so the upsert only refreshes matched_at
+        # instead of rewriting the stored payload.
+        cur.executemany(
+            """
+            INSERT INTO rule_matches (rule_id, opportunity_id, payload, payload_hash)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(rule_id, opportunity_id) DO UPDATE
+                SET matched_at = CURRENT_TIMESTAMP,
+                    payload = COALESCE(excluded.payload, payload),
+                    payload_hash = COALESCE(excluded.payload_hash, payload_hash)
+            """,
+            [
+                (rule_id, opportunity_id, None, None)
+                if payload_hash is not None and existing.get(opportunity_id) == payload_hash
+                else (rule_id, opportunity_id, payload_json, payload_hash)
+                for opportunity_id, (payload_json, payload_hash, _) in rows.items()
+            ],
+        )
+        # Only first-time matches notify; a changed payload on a known match is stored
+        # but not re-sent, since volatile columns would otherwise re-alert every sweep.
+        return [
+            MatchRecord(opportunity_id, payload)
+            for opportunity_id, (_, _, payload) in rows.items()
+            if opportunity_id not in existing
+        ]
 
     def _dispatch_notifications(
-        self, rule_id: int, rule_name: str, matches: Sequence[MatchRecord]
+        self,
+        rule_name: str,
+        matches: Sequence[MatchRecord],
+        destinations: Sequence[AlertDestination],
+        summaries: Mapping[int, Mapping[str, Any]],
     ) -> None:
         if not matches:
             return
-        destinations = self._load_destinations(rule_id)
         if not destinations:
             logger.info("No alert destinations configured for rule %s", rule_name)
             return
 
-        summaries = self._load_opportunity_summaries(
-            [match.opportunity_id for match in matches]
-        )
         entries: list[dict[str, Any]] = []
         for match in matches:
             summary = summaries.get(match.opportunity_id, {})
@@ -173,60 +403,91 @@ class AlertEngine:
                     "agency": summary.get("agency"),
                     "posted_at": summary.get("posted_at"),
                     "url": self._build_notice_url(notice_id) if notice_id else None,
-                    "payload": dict(match.payload) if match.payload else {},
+                    "payload": match.payload or {},
                 }
             )
 
-        normalized_entries = self._normalize_entries(entries)
-        context = self._build_notification_context(rule_name, normalized_entries)
+        # Payloads hold SQLite column values; anything json cannot encode natively (BLOBs)
+        # is stringified by ``default=str`` when a channel serializes the entries.
+        context = self._build_notification_context(rule_name, entries)
 
-        for destination in destinations:
-            try:
-                self._send_notification(destination, rule_name, normalized_entries, context)
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.exception(
-                    "Failed to deliver alert %s via %s: %s",
-                    destination.id,
-                    destination.method,
-                    exc,
-                )
+        if len(destinations) == 1:
+            self._deliver_safely(destinations[0], rule_name, entries, context)
+            return
+        # Destinations are independent, so a slow webhook must not hold up email or CLI
+        # delivery. Pooled SMTP sends still serialize on the connection pool lock.
+        workers = min(len(destinations), _MAX_DELIVERY_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="samwatch-alert") as pool:
+            for destination in destinations:
+                pool.submit(self._deliver_safely, destination, rule_name, entries, context)
+
+    def _deliver_safely(
+        self,
+        destination: AlertDestination,
+        rule_name: str,
+        entries: Sequence[dict[str, Any]],
+        context: Mapping[str, Any],
+    ) -> None:
+        try:
+            self._send_notification(destination, rule_name, entries, context)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            logger.exception(
+                "Failed to deliver alert %s via %s: %s",
+                destination.id,
+                destination.method,
+                exc,
+            )
 
-    def _load_destinations(self, rule_id: int) -> list[AlertDestination]:
-        cursor = self.database.execute(
-            "SELECT id, delivery_method, target FROM alerts WHERE rule_id = ?",
-            (rule_id,),
-        )
-        rows = cursor.fetchall()
-        return [
-            AlertDestination(
-                id=row["id"],
-                method=str(row["delivery_method"]),
-                target=str(row["target"]),
+    def _load_destinations(
+        self, rule_ids: Sequence[int]
+    ) -> dict[int, list[AlertDestination]]:
+        destinations: dict[int, list[AlertDestination]] = {}
+        unique_ids = list(dict.fromkeys(rule_ids))
+        for start in range(0, len(unique_ids), _MAX_SQL_PARAMETERS):
+            chunk = unique_ids[start : start + _MAX_SQL_PARAMETERS]
+            placeholders, parameters = in_clause(chunk)
+            cursor = self.database.execute(
+                f"""
+                SELECT id, rule_id, delivery_method, target
+                FROM alerts
+                WHERE rule_id IN ({placeholders})
+                ORDER BY id
+                """,
+                parameters,
             )
-            for row in rows
-        ]
+            for row in cursor.fetchall():
+                destinations.setdefault(row["rule_id"], []).append(
+                    AlertDestination(
+                        id=row["id"],
+                        method=str(row["delivery_method"]),
+                        target=str(row["target"]),
+                    )
+                )
+        return destinations
 
     def _load_opportunity_summaries(
         self, opportunity_ids: Sequence[int]
     ) -> dict[int, dict[str, Any]]:
-        if not opportunity_ids:
-            return {}
+        summaries: dict[int, dict[str, Any]] = {}
         unique_ids = list(dict.fromkeys(opportunity_ids))
-        placeholders = ",".join("?" for _ in unique_ids)
-        cursor = self.database.execute(
-            f"""
-            SELECT id, notice_id, title, agency, posted_at
-            FROM opportunities
-            WHERE id IN ({placeholders})
-            """,
-            unique_ids,
-        )
-        return {row["id"]: dict(row) for row in cursor.fetchall()}
+        for start in range(0, len(unique_ids), _MAX_SQL_PARAMETERS):
+            chunk = unique_ids[start : start + _MAX_SQL_PARAMETERS]
+            placeholders, parameters = in_clause(chunk)
+            cursor = self.database.execute(
+                f"""
+                SELECT id, notice_id, title, agency, posted_at
+                FROM opportunities
+                WHERE id IN ({placeholders})
+                """,
+                parameters,
+            )
+            summaries.update((row["id"], dict(row)) for row in cursor.fetchall())
+        return summaries
 
     def _build_notice_url(self, notice_id: str | None) -> str | None:
         if not notice_id:
             return None
-        return f"https://sam.gov/opp/{notice_id}/view"
+        return _NOTICE_URL_PREFIX + notice_id + "/view"
 
     def _send_notification(
         self,
@@ -271,12 +532,49 @@ class AlertEngine:
         else:
             logger.warning("Unsupported alert delivery method %s", destination.method)
 
+    def _http_client(self) -> httpx.Client:
+        with self._http_lock:
+            if self._http is None:
+                import httpx
+
+                self._http = httpx.Client(
+                    timeout=self.config.http_timeout,
+                    limits=httpx.Limits(max_keepalive_connections=32),
+                )
+            return self._http
+
+    @cached_property
+    def _console(self) -> Console:
+        from rich.console import Console
+
+        return Console()
+
     def _send_cli_notification(
         self,
         rule_name: str,
         entries: Sequence[dict[str, Any]],
         context: Mapping[str, Any],
     ) -> None:
+        # Rich layout is only worth its cost when a person is watching the terminal.
+        if not self.config.alert_rich_output or not sys.stdout.isatty():
+            lines = [f"Alert matches for rule: {rule_name}"]
+            lines.extend(
+                "\t".join(
+                    (
+                        entry.get("notice_id") or "-",
+                        entry.get("title") or "-",
+                        entry.get("agency") or "-",
+                        entry.get("url") or "-",
+                    )
+                )
+                for entry in entries
+            )
+            lines.append(f"Summary: {context.get('summary', 'n/a')}")
+            print("\n".join(lines))
+            return
+
+        from rich.table import Table
+
         table = Table(title=f"Alert matches for rule: {rule_name}")
         table.add_column("Notice ID")
         table.add_column("Title")
@@ -300,14 +598,14 @@ class AlertEngine:
         context: Mapping[str, Any],
     ) -> None:
         parsed_target = self._parse_target(target)
-        headers: dict[str, str] | None = None
+        headers = {"Content-Type": "application/json"}
         url: str | None = None
         template_payload: Mapping[str, Any] | None = None
         if isinstance(parsed_target, Mapping):
             url = str(parsed_target.get("url")) if parsed_target.get("url") else None
             headers_obj = parsed_target.get("headers") or {}
             if isinstance(headers_obj, Mapping):
-                headers = {str(k): str(v) for k, v in headers_obj.items()}
+                headers.update((str(k), str(v)) for k, v in headers_obj.items())
             template = parsed_target.get("template")
             if isinstance(template, Mapping):
                 template_payload = template
@@ -322,11 +620,8 @@ class AlertEngine:
             if isinstance(message_template, str) and message_template:
                 message = self._render_template(message_template, context)
         payload = {"rule": rule_name, "matches": entries, "summary": message or summary}
-        response = httpx.post(
-            url,
-            json=payload,
-            headers=headers,
-            timeout=self.config.http_timeout,
+        response = self._http_client().post(
+            url, content=_webhook_body(payload), headers=headers
         )
         response.raise_for_status()
 
@@ -373,20 +668,10 @@ class AlertEngine:
         if isinstance(body_template, str) and body_template:
             body_content = self._render_template(body_template, context)
         else:
-            body_lines = [f"Matches for rule {rule_name}:", ""]
-            for entry in entries:
-                notice_ref = entry.get("notice_id") or entry.get("opportunity_id")
-                title = entry.get("title") or "Untitled"
-                body_lines.append(f"- {notice_ref}: {title}")
-                if entry.get("url"):
-                    body_lines.append(f"  URL: {entry['url']}")
-                if entry.get("agency"):
-                    body_lines.append(f"  Agency: {entry['agency']}")
-                if entry.get("payload"):
-                    body_lines.append("  Payload:")
-                    body_lines.append(json.dumps(entry["payload"], indent=2, default=str))
-                body_lines.append("")
-            body_content = "\n".join(body_lines)
+            body_content = "\n".join(
+                [f"Matches for rule {rule_name}:", ""]
+                + [self._format_email_entry(entry) for entry in entries]
+            )
 
         message = EmailMessage()
         message["Subject"] = subject
@@ -399,39 +684,71 @@ class AlertEngine:
         password = settings.get("password")
         use_tls = bool(settings.get("use_tls", False))
 
-        with smtplib.SMTP(str(smtp_server), port, timeout=self.config.http_timeout) as smtp:
-            if use_tls:
-                smtp.starttls()
-            if username and password:
-                smtp.login(str(username), str(password))
-            smtp.send_message(message)
+        key = (str(smtp_server), port, str(username) if username else None, use_tls)
+        with self._smtp_lock:
+            smtp = self._smtp_connections.get(key)
+            if smtp is not None:
+                try:
+                    smtp.send_message(message)
+                    return
+                except (smtplib.SMTPServerDisconnected, ConnectionError):
+                    logger.debug("Pooled SMTP connection to %s dropped; reconnecting", smtp_server)
+                    del self._smtp_connections[key]
+                    smtp.close()
+
+            smtp = smtplib.SMTP(str(smtp_server), port, timeout=self.config.http_timeout)
+            try:
+                if use_tls:
+                    smtp.starttls()
+                if username and password:
+                    smtp.login(str(username), str(password))
+                smtp.send_message(message)
+            except Exception:
+                smtp.close()
+                raise
+            self._smtp_connections[key] = smtp
+
+    @staticmethod
+    def _format_email_entry(entry: Mapping[str, Any]) -> str:
+        notice_ref = entry.get("notice_id") or entry.get("opportunity_id")
+        url = entry.get("url")
+        agency = entry.get("agency")
+        payload = entry.get("payload")
+        return "".join(
+            (
+                f"- {notice_ref}: {entry.get('title') or 'Untitled'}\n",
+                f"  URL: {url}\n" if url else "",
+                f"  Agency: {agency}\n" if agency else "",
+                (
+                    f"  Payload:\n{json.dumps(payload, separators=(',', ':'), default=str)}\n"
+                    if payload
+                    else ""
+                ),
+            )
+        )
+
+    def close(self) -> None:
+        """Release pooled HTTP and SMTP connections."""
+
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+        with self._smtp_lock:
+            connections = list(self._smtp_connections.values())
+            self._smtp_connections.clear()
+        for smtp in connections:
+            try:
+                smtp.quit()
+            except OSError:
+                smtp.close()
 
     def _parse_target(self, target: str) -> Any:
         try:
-            return json.loads(target)
+            return _parse_json_cached(target)
         except json.JSONDecodeError:
             return target
 
-    def _normalize_entries(
-        self, entries: Sequence[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        return [
-            {
-                **entry,
-                "payload": self._normalize_payload(entry.get("payload", {})),
-            }
-            for entry in entries
-        ]
-
-    def _normalize_payload(self, payload: Any) -> Any:
-        if isinstance(payload, Mapping):
-            return {k: self._normalize_payload(v) for k, v in payload.items()}
-        if isinstance(payload, list):
-            return [self._normalize_payload(item) for item in payload]
-        if isinstance(payload, str | int | float | bool) or payload is None:
-            return payload
-        return str(payload)
-
     def _build_notification_context(
         self, rule_name: str, entries: Sequence[dict[str, Any]]
     ) -> dict[str, Any]:
@@ -27,7 +27,7 @@ def _build_context(with_client: bool = True) -> tuple[Config, Database, SAMWatch
     """Instantiate shared objects for CLI commands."""
 
     config = Config.from_env()
-    database = Database(config.sqlite_path)
+    database = Database(config.sqlite_path, durable=config.sqlite_durable)
     database.initialize_schema()
     client = SAMWatchClient(config) if with_client else None
     return config, database, client
@@ -115,7 +115,9 @@ def serve(
     if config.metrics_enabled:
         try:
             metrics_exporter = PrometheusSchedulerMetrics(
-                host=config.metrics_host, port=config.metrics_port
+                host=config.metrics_host,
+                port=config.metrics_port,
+                cache_ttl=config.metrics_cache_ttl,
             )
             metrics_exporter.start()
             logger.info(
@@ -129,8 +131,9 @@ def serve(
 
     scheduler = Scheduler(metrics_recorder=metrics_exporter)
 
+    jobs: list[ScheduledJob] = []
     if include_hot:
-        scheduler.add_job(
+        jobs.append(
             ScheduledJob(
                 name="hot",
                 interval=timedelta(minutes=config.hot_frequency_minutes),
@@ -138,7 +141,7 @@ def serve(
             )
         )
     if include_warm:
-        scheduler.add_job(
+        jobs.append(
             ScheduledJob(
                 name="warm",
                 interval=timedelta(minutes=config.warm_frequency_minutes),
@@ -146,7 +149,7 @@ def serve(
             )
         )
     if include_refresh:
-        scheduler.add_job(
+        jobs.append(
             ScheduledJob(
                 name="refresh",
                 interval=timedelta(hours=config.cold_frequency_hours),
@@ -163,13 +166,14 @@ def serve(
         except Exception:  # pragma: no cover - defensive logging
             logger.exception("Health check query failed")
 
-    scheduler.add_job(
+    jobs.append(
         ScheduledJob(
             name="health",
             interval=timedelta(minutes=max(1, health_interval_minutes)),
             action=_health_check,
         )
     )
+    scheduler.add_jobs(jobs)
 
     try:
         scheduler.run()
@@ -219,10 +223,11 @@ def alerts() -> None:
     """Evaluate all pursuit rules and persist matches."""
 
     config, database, client = _build_context(with_client=False)
+    engine = AlertEngine(config, database)
     try:
-        engine = AlertEngine(config, database)
         engine.evaluate_rules()
     finally:
+        engine.close()
         database.close()
         if client:
             client.close()
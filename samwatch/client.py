@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import json
 import logging
-from collections.abc import Iterable, Mapping
+import os
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -15,8 +22,39 @@ from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_ex
 from .config import Config
 from .ratelimit import RateLimiter
 
+try:  # pragma: no cover - optional dependency
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# orjson parses search pages several times faster than the stdlib; both accept bytes.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Large chunks keep hashlib's OpenSSL-backed update() above the size at which it
+# releases the GIL, so hashing overlaps with network and disk I/O.
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+def _drop_page_cache(fd: int) -> None:
+    """Flush a finished download and ask the kernel to evict its pages from the cache.
+
+    Attachments are archived rather than re-read, so keeping them cached only pushes
+    out the database's pages. A no-op where ``posix_fadvise`` is unavailable.
+    """
+
+    if hasattr(os, "posix_fadvise"):
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _run_until_stopped(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
 
 class SAMClientError(RuntimeError):
     """Generic error raised when the SAM API returns an error response."""
@@ -52,9 +90,47 @@ class SAMWatchClient:
             headers={"X-Api-Key": config.api_key},
             follow_redirects=True,
         )
+        # download_attachments runs on one long-lived event loop thread with a shared
+        # AsyncClient, so attachment connections stay pooled across batches instead of
+        # being re-established by a fresh asyncio.run() each time.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        self._async_client: httpx.AsyncClient | None = None
 
     def close(self) -> None:
         self._client.close()
+        loop = self._loop
+        if loop is not None:
+            if self._async_client is not None:
+                asyncio.run_coroutine_threadsafe(self._async_client.aclose(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            self._loop = None
+            self._async_client = None
+
+    def _new_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            timeout=self._config.http_timeout,
+            headers={"X-Api-Key": self._config.api_key},
+            follow_redirects=True,
+        )
+
+    def _download_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=_run_until_stopped, args=(loop,), name="samwatch-downloads", daemon=True
+                ).start()
+                self._loop = loop
+            return self._loop
+
+    async def _shared_download_batch(
+        self, downloads: Sequence[tuple[str, Path]]
+    ) -> list[AttachmentDownload | BaseException]:
+        # Runs on the download loop, the only place _async_client is touched.
+        if self._async_client is None:
+            self._async_client = self._new_async_client()
+        return await self.download_attachments_async(downloads, client=self._async_client)
 
     def _perform_request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
         if not self._rate_limiter.acquire():
@@ -67,6 +143,10 @@ class SAMWatchClient:
             suffix = path.lstrip("/")
             url = f"{base}/{suffix}"
         response = self._client.request(method, url, **kwargs)
+        self._check_response(response)
+        return response
+
+    def _check_response(self, response: httpx.Response) -> None:
         self._rate_limiter.update_from_headers(response.headers)
         if response.status_code == 429:
             retry_after = response.headers.get("Retry-After")
@@ -77,7 +157,6 @@ class SAMWatchClient:
             raise SAMClientError(
                 f"SAM.gov API error: {response.status_code} {response.text[:200]}"
             )
-        return response
 
     def search_opportunities(self, params: Mapping[str, Any]) -> dict[str, Any]:
         """Search for opportunities using the SAM.gov search endpoint."""
@@ -85,7 +164,7 @@ class SAMWatchClient:
         query = dict(params)
         query.setdefault("limit", min(self._config.search_limit, 1000))
         response = self._perform_request("GET", "search", params=query)
-        return response.json()
+        return _json_loads(response.content)
 
     def fetch_description(self, description_url: str) -> str:
         """Fetch detailed notice description text."""
@@ -110,10 +189,62 @@ class SAMWatchClient:
             hash_ctx = hashlib.sha256()
             bytes_written = 0
             with destination.open("wb") as handle:
-                for chunk in response.iter_bytes():
+                for chunk in response.iter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
                     handle.write(chunk)
                     hash_ctx.update(chunk)
                     bytes_written += len(chunk)
+                if self._config.attachment_drop_cache:
+                    handle.flush()
+                    _drop_page_cache(handle.fileno())
+        return AttachmentDownload(
+            url=url,
+            path=destination,
+            sha256=hash_ctx.hexdigest(),
+            bytes_written=bytes_written,
+        )
+
+    @retry(
+        retry=retry_if_exception_type((httpx.TransportError, SAMClientError)),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True,
+    )
+    async def download_attachment_async(
+        self,
+        url: str,
+        destination: Path,
+        client: httpx.AsyncClient,
+        take_reserved: Callable[[], bool] | None = None,
+    ) -> AttachmentDownload:
+        """Download an attachment on ``client`` without blocking the event loop.
+
+        Disk writes are handed to the default executor so they overlap with network reads
+        of other downloads in the same batch. ``take_reserved`` hands out tokens the
+        batch reserved up front; each attempt only waits on the limiter once it is spent.
+        """
+
+        if not (take_reserved is not None and take_reserved()) and not await asyncio.to_thread(
+            self._rate_limiter.acquire
+        ):
+            raise SAMClientError("Unable to obtain rate limit token")
+        await asyncio.to_thread(destination.parent.mkdir, parents=True, exist_ok=True)
+        async with client.stream("GET", url) as response:
+            if response.is_error:
+                await response.aread()
+            await asyncio.to_thread(self._check_response, response)
+            hash_ctx = hashlib.sha256()
+            bytes_written = 0
+            handle = await asyncio.to_thread(destination.open, "wb")
+            try:
+                async for chunk in response.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(handle.write, chunk)
+                    hash_ctx.update(chunk)
+                    bytes_written += len(chunk)
+                if self._config.attachment_drop_cache:
+                    await asyncio.to_thread(handle.flush)
+                    await asyncio.to_thread(_drop_page_cache, handle.fileno())
+            finally:
+                await asyncio.to_thread(handle.close)
         return AttachmentDownload(
             url=url,
             path=destination,
@@ -121,18 +252,96 @@ class SAMWatchClient:
             bytes_written=bytes_written,
         )
 
+    async def download_attachments_async(
+        self,
+        downloads: Sequence[tuple[str, Path]],
+        client: httpx.AsyncClient | None = None,
+    ) -> list[AttachmentDownload | BaseException]:
+        """Download ``(url, destination)`` pairs concurrently.
+
+        Results are returned in input order; failed downloads are returned as the raised
+        exception rather than aborting the rest of the batch. Without ``client`` a
+        temporary one is opened for the batch.
+        """
+
+        if client is None:
+            async with self._new_async_client() as client:
+                return await self.download_attachments_async(downloads, client)
+
+        semaphore = asyncio.Semaphore(max(1, self._config.download_concurrency))
+        # Reserve tokens for the whole batch at once; only the shortfall goes through
+        # acquire() one request at a time. The counter is only touched on the event loop.
+        reserved = self._rate_limiter.reserve(len(downloads))
+
+        def take_reserved() -> bool:
+            nonlocal reserved
+            if reserved <= 0:
+                return False
+            reserved -= 1
+            return True
+
+        async def download(url: str, destination: Path) -> AttachmentDownload:
+            async with semaphore:
+                return await self.download_attachment_async(
+                    url, destination, client, take_reserved
+                )
+
+        return await asyncio.gather(
+            *(download(url, destination) for url, destination in downloads),
+            return_exceptions=True,
+        )
+
+    def download_attachments(
+        self,
+        downloads: Sequence[tuple[str, Path]],
+    ) -> list[AttachmentDownload | BaseException]:
+        """Synchronous entry point for :meth:`download_attachments_async`.
+
+        Batches run on the client's download loop and share its pooled connections.
+        """
+
+        if not downloads:
+            return []
+        return asyncio.run_coroutine_threadsafe(
+            self._shared_download_batch(downloads), self._download_loop()
+        ).result()
+
     def iter_search(self, params: Mapping[str, Any]) -> Iterable[dict[str, Any]]:
-        """Iterate through paginated search results."""
+        """Iterate through paginated search results.
+
+        The first page reports ``totalRecords``; the remaining offsets are then fetched
+        concurrently (bounded by ``search_workers``) and yielded in offset order.
+        """
 
         offset = int(params.get("offset", 0))
         limit = int(params.get("limit", min(self._config.search_limit, 1000)))
-        while True:
-            payload = dict(params, offset=offset, limit=limit)
-            data = self.search_opportunities(payload)
-            records = data.get("opportunitiesData", [])
-            if not records:
-                break
-            yield from records
-            offset += limit
-            if offset >= data.get("totalRecords", 0):
-                break
+        data = self.search_opportunities(dict(params, offset=offset, limit=limit))
+        records = data.get("opportunitiesData", [])
+        if not records:
+            return
+        yield from records
+
+        offsets = iter(range(offset + limit, int(data.get("totalRecords", 0)), limit))
+        workers = max(1, self._config.search_workers)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="samwatch-search")
+        try:
+            pending: deque[Future[dict[str, Any]]] = deque(
+                pool.submit(self.search_opportunities, dict(params, offset=page, limit=limit))
+                for page in islice(offsets, workers)
+            )
+            while pending:
+                data = pending.popleft().result()
+                next_page = next(offsets, None)
+                if next_page is not None:
+                    pending.append(
+                        pool.submit(
+                            self.search_opportunities,
+                            dict(params, offset=next_page, limit=limit),
+                        )
+                    )
+                records = data.get("opportunitiesData", [])
+                if not records:
+                    break
+                yield from records
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
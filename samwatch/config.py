@@ -4,14 +4,44 @@ from __future__ import annotations
 
 import os
 from collections.abc import Mapping, MutableMapping
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from pathlib import Path
+from types import SimpleNamespace
 
 
 class ConfigError(RuntimeError):
     """Raised when the runtime configuration is invalid."""
 
 
+# Every variable read by Config.from_env; keep in sync when adding settings.
+_ENV_KEYS = (
+    "SAM_API_KEY",
+    "SAMWATCH_DATA_DIR",
+    "SAMWATCH_SQLITE_PATH",
+    "SAMWATCH_SQLITE_DURABLE",
+    "SAMWATCH_FILES_DIR",
+    "SAMWATCH_BASE_URL",
+    "SAMWATCH_SEARCH_LIMIT",
+    "SAMWATCH_SEARCH_WORKERS",
+    "SAMWATCH_DOWNLOAD_CONCURRENCY",
+    "SAMWATCH_ATTACHMENT_DROP_CACHE",
+    "SAMWATCH_HOURLY_CAP",
+    "SAMWATCH_DAILY_CAP",
+    "SAMWATCH_HTTP_TIMEOUT",
+    "SAMWATCH_HOT_FREQUENCY",
+    "SAMWATCH_WARM_FREQUENCY",
+    "SAMWATCH_COLD_FREQUENCY",
+    "SAMWATCH_ALERT_RETRY_ATTEMPTS",
+    "SAMWATCH_ALERT_RETRY_BACKOFF",
+    "SAMWATCH_RULE_WORKERS",
+    "SAMWATCH_ALERT_RICH_OUTPUT",
+    "SAMWATCH_METRICS_ENABLED",
+    "SAMWATCH_METRICS_HOST",
+    "SAMWATCH_METRICS_PORT",
+    "SAMWATCH_METRICS_CACHE_TTL",
+)
+
+
 def _as_bool(value: object, default: bool) -> bool:
     """Parse a boolean value from a variety of inputs."""
 
@@ -32,16 +62,36 @@ def _as_bool(value: object, default: bool) -> bool:
     return bool(value)
 
 
-@dataclass(slots=True)
+def _as_path(value: object) -> Path:
+    return value if isinstance(value, Path) else Path(str(value))
+
+
+def _field_defaults(cls: type) -> SimpleNamespace:
+    """Return the declared field defaults of a dataclass.
+
+    ``slots=True`` removes the defaults from the class namespace, so ``cls.<field>``
+    resolves to the slot descriptor rather than the default value.
+    """
+
+    return SimpleNamespace(
+        **{item.name: item.default for item in fields(cls) if item.default is not MISSING}
+    )
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Config:
     """Runtime configuration for the SAMWatch service."""
 
     api_key: str
     data_dir: Path = field(default_factory=lambda: Path("data"))
     sqlite_path: Path = field(default_factory=lambda: Path("data/sqlite/samwatch.db"))
+    sqlite_durable: bool = False
     files_dir: Path = field(default_factory=lambda: Path("data/files"))
     base_url: str = "https://api.sam.gov/opportunities/v2"
     search_limit: int = 100
+    search_workers: int = 4
+    download_concurrency: int = 8
+    attachment_drop_cache: bool = False
     hourly_request_cap: int = 1000
     daily_request_cap: int | None = None
     http_timeout: float = 30.0
@@ -50,9 +100,17 @@ class Config:
     cold_frequency_hours: int = 12
     alert_retry_attempts: int = 3
     alert_retry_backoff_seconds: float = 2.0
+    rule_workers: int = 4
+    alert_rich_output: bool = True
     metrics_enabled: bool = True
     metrics_host: str = "0.0.0.0"
     metrics_port: int = 9464
+    metrics_cache_ttl: float = 1.0
+    _as_dict: dict[str, object] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen, so the serialized layout can be built once; as_dict hands out copies.
+        object.__setattr__(self, "_as_dict", self._build_dict())
 
     @classmethod
     def from_env(
@@ -60,13 +118,16 @@ class Config:
     ) -> Config:
         """Create a :class:`Config` instance from environment variables."""
 
-        env = env or os.environ
+        source = env or os.environ
+        # One lookup per known key; os.environ encodes and decodes on every access.
+        env = {key: source[key] for key in _ENV_KEYS if key in source}
+        defaults = _field_defaults(cls)
         api_key = str(overrides.pop("api_key", env.get("SAM_API_KEY", "")))
         if not api_key:
             raise ConfigError("SAM_API_KEY must be provided via environment or overrides")
 
-        data_dir = Path(overrides.pop("data_dir", env.get("SAMWATCH_DATA_DIR", "data")))
-        sqlite_path = Path(
+        data_dir = _as_path(overrides.pop("data_dir", env.get("SAMWATCH_DATA_DIR", "data")))
+        sqlite_path = _as_path(
             overrides.pop(
                 "sqlite_path",
                 env.get(
@@ -75,7 +136,7 @@ class Config:
                 ),
             )
         )
-        files_dir = Path(
+        files_dir = _as_path(
             overrides.pop(
                 "files_dir",
                 env.get("SAMWATCH_FILES_DIR", data_dir / "files"),
@@ -87,16 +148,44 @@ class Config:
             data_dir=data_dir,
             sqlite_path=sqlite_path,
             files_dir=files_dir,
+            sqlite_durable=_as_bool(
+                overrides.pop(
+                    "sqlite_durable",
+                    env.get("SAMWATCH_SQLITE_DURABLE", defaults.sqlite_durable),
+                ),
+                defaults.sqlite_durable,
+            ),
             base_url=str(
-                overrides.pop("base_url", env.get("SAMWATCH_BASE_URL", cls.base_url))
+                overrides.pop("base_url", env.get("SAMWATCH_BASE_URL", defaults.base_url))
             ),
             search_limit=int(
-                overrides.pop("search_limit", env.get("SAMWATCH_SEARCH_LIMIT", cls.search_limit))
+                overrides.pop(
+                    "search_limit", env.get("SAMWATCH_SEARCH_LIMIT", defaults.search_limit)
+                )
+            ),
+            search_workers=int(
+                overrides.pop(
+                    "search_workers",
+                    env.get("SAMWATCH_SEARCH_WORKERS", defaults.search_workers),
+                )
+            ),
+            download_concurrency=int(
+                overrides.pop(
+                    "download_concurrency",
+                    env.get("SAMWATCH_DOWNLOAD_CONCURRENCY", defaults.download_concurrency),
+                )
+            ),
+            attachment_drop_cache=_as_bool(
+                overrides.pop(
+                    "attachment_drop_cache",
+                    env.get("SAMWATCH_ATTACHMENT_DROP_CACHE", defaults.attachment_drop_cache),
+                ),
+                defaults.attachment_drop_cache,
             ),
             hourly_request_cap=int(
                 overrides.pop(
                     "hourly_request_cap",
-                    env.get("SAMWATCH_HOURLY_CAP", cls.hourly_request_cap),
+                    env.get("SAMWATCH_HOURLY_CAP", defaults.hourly_request_cap),
                 )
             ),
             daily_request_cap=(
@@ -104,35 +193,35 @@ class Config:
                 if (daily_cap := overrides.pop(
                     "daily_request_cap", env.get("SAMWATCH_DAILY_CAP", "")
                 ))
-                else cls.daily_request_cap
+                else defaults.daily_request_cap
             ),
             http_timeout=float(
                 overrides.pop(
-                    "http_timeout", env.get("SAMWATCH_HTTP_TIMEOUT", cls.http_timeout)
+                    "http_timeout", env.get("SAMWATCH_HTTP_TIMEOUT", defaults.http_timeout)
                 )
             ),
             hot_frequency_minutes=int(
                 overrides.pop(
                     "hot_frequency_minutes",
-                    env.get("SAMWATCH_HOT_FREQUENCY", cls.hot_frequency_minutes),
+                    env.get("SAMWATCH_HOT_FREQUENCY", defaults.hot_frequency_minutes),
                 )
             ),
             warm_frequency_minutes=int(
                 overrides.pop(
                     "warm_frequency_minutes",
-                    env.get("SAMWATCH_WARM_FREQUENCY", cls.warm_frequency_minutes),
+                    env.get("SAMWATCH_WARM_FREQUENCY", defaults.warm_frequency_minutes),
                 )
             ),
             cold_frequency_hours=int(
                 overrides.pop(
                     "cold_frequency_hours",
-                    env.get("SAMWATCH_COLD_FREQUENCY", cls.cold_frequency_hours),
+                    env.get("SAMWATCH_COLD_FREQUENCY", defaults.cold_frequency_hours),
                 )
             ),
             alert_retry_attempts=int(
                 overrides.pop(
                     "alert_retry_attempts",
-                    env.get("SAMWATCH_ALERT_RETRY_ATTEMPTS", cls.alert_retry_attempts),
+                    env.get("SAMWATCH_ALERT_RETRY_ATTEMPTS", defaults.alert_retry_attempts),
                 )
             ),
             alert_retry_backoff_seconds=float(
@@ -140,25 +229,43 @@ class Config:
                     "alert_retry_backoff_seconds",
                     env.get(
                         "SAMWATCH_ALERT_RETRY_BACKOFF",
-                        cls.alert_retry_backoff_seconds,
+                        defaults.alert_retry_backoff_seconds,
                     ),
                 )
             ),
+            rule_workers=int(
+                overrides.pop(
+                    "rule_workers", env.get("SAMWATCH_RULE_WORKERS", defaults.rule_workers)
+                )
+            ),
+            alert_rich_output=_as_bool(
+                overrides.pop(
+                    "alert_rich_output",
+                    env.get("SAMWATCH_ALERT_RICH_OUTPUT", defaults.alert_rich_output),
+                ),
+                defaults.alert_rich_output,
+            ),
             metrics_enabled=_as_bool(
                 overrides.pop(
                     "metrics_enabled",
-                    env.get("SAMWATCH_METRICS_ENABLED", cls.metrics_enabled),
+                    env.get("SAMWATCH_METRICS_ENABLED", defaults.metrics_enabled),
                 ),
-                cls.metrics_enabled,
+                defaults.metrics_enabled,
             ),
             metrics_host=str(
                 overrides.pop(
-                    "metrics_host", env.get("SAMWATCH_METRICS_HOST", cls.metrics_host)
+                    "metrics_host", env.get("SAMWATCH_METRICS_HOST", defaults.metrics_host)
                 )
             ),
             metrics_port=int(
                 overrides.pop(
-                    "metrics_port", env.get("SAMWATCH_METRICS_PORT", cls.metrics_port)
+                    "metrics_port", env.get("SAMWATCH_METRICS_PORT", defaults.metrics_port)
+                )
+            ),
+            metrics_cache_ttl=float(
+                overrides.pop(
+                    "metrics_cache_ttl",
+                    env.get("SAMWATCH_METRICS_CACHE_TTL", defaults.metrics_cache_ttl),
                 )
             ),
         )
@@ -173,19 +280,29 @@ class Config:
     def ensure_directories(self) -> None:
         """Ensure that filesystem paths required by the service exist."""
 
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        self.sqlite_path.parent.mkdir(parents=True, exist_ok=True)
-        self.files_dir.mkdir(parents=True, exist_ok=True)
+        directories = {self.data_dir, self.sqlite_path.parent, self.files_dir}
+        for directory in directories:
+            # Creating the deepest directories also creates their ancestors.
+            if any(directory in other.parents for other in directories):
+                continue
+            directory.mkdir(parents=True, exist_ok=True)
 
     def as_dict(self) -> dict[str, object]:
         """Serialize configuration to a mapping for debugging or logging."""
 
+        return dict(self._as_dict)
+
+    def _build_dict(self) -> dict[str, object]:
         return {
             "base_url": self.base_url,
             "data_dir": str(self.data_dir),
             "sqlite_path": str(self.sqlite_path),
+            "sqlite_durable": self.sqlite_durable,
             "files_dir": str(self.files_dir),
             "search_limit": self.search_limit,
+            "search_workers": self.search_workers,
+            "download_concurrency": self.download_concurrency,
+            "attachment_drop_cache": self.attachment_drop_cache,
             "hourly_request_cap": self.hourly_request_cap,
             "daily_request_cap": self.daily_request_cap,
             "http_timeout": self.http_timeout,
@@ -194,7 +311,10 @@ class Config:
             "cold_frequency_hours": self.cold_frequency_hours,
             "alert_retry_attempts": self.alert_retry_attempts,
             "alert_retry_backoff_seconds": self.alert_retry_backoff_seconds,
+            "rule_workers": self.rule_workers,
+            "alert_rich_output": self.alert_rich_output,
             "metrics_enabled": self.metrics_enabled,
             "metrics_host": self.metrics_host,
             "metrics_port": self.metrics_port,
+            "metrics_cache_ttl": self.metrics_cache_ttl,
         }
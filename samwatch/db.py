@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import sqlite3
+import time
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
-from datetime import UTC, datetime
-from pathlib import Path
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 SCHEMA_STATEMENTS: Sequence[str] = (
-    """
-    PRAGMA foreign_keys = ON;
-    """,
     """
     CREATE TABLE IF NOT EXISTS opportunities (
         id INTEGER PRIMARY KEY,
@@ -110,6 +112,7 @@ SCHEMA_STATEMENTS: Sequence[str] = (
         opportunity_id INTEGER NOT NULL REFERENCES opportunities(id) ON DELETE CASCADE,
         matched_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
         payload TEXT,
+        payload_hash TEXT,
         UNIQUE(rule_id, opportunity_id)
     );
     """,
@@ -123,57 +126,365 @@ SCHEMA_STATEMENTS: Sequence[str] = (
     );
     """,
     """
-    CREATE VIRTUAL TABLE IF NOT EXISTS opportunity_search USING fts5(
-        title, agency, body, content='descriptions', content_rowid='opportunity_id'
+    CREATE INDEX IF NOT EXISTS idx_awards_opp ON awards(opportunity_id);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_contacts_opp ON contacts(opportunity_id);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_descriptions_opp ON descriptions(opportunity_id);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_attachments_opp ON attachments(opportunity_id);
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS opportunity_naics (
+        code TEXT NOT NULL,
+        opportunity_id INTEGER NOT NULL REFERENCES opportunities(id) ON DELETE CASCADE,
+        PRIMARY KEY (code, opportunity_id)
+    ) WITHOUT ROWID;
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_opportunity_naics_opp ON opportunity_naics(opportunity_id);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_rule_matches_opp ON rule_matches(opportunity_id);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_run_metrics_run ON run_metrics(run_id);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_opportunities_posted ON opportunities(posted_at);
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_opportunities_last_seen ON opportunities(last_seen_at);
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts USING fts5(
+        notice_id, title, agency, sub_tier, office, notice_type, status, naics_codes, set_aside,
+        content='opportunities', content_rowid='id', tokenize='trigram'
     );
     """,
     """
-    CREATE TRIGGER IF NOT EXISTS descriptions_ai AFTER INSERT ON descriptions
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_ai AFTER INSERT ON opportunities
     BEGIN
-        INSERT INTO opportunity_search(rowid, title, agency, body)
-        SELECT
-            NEW.opportunity_id,
-            o.title,
-            o.agency,
-            NEW.body
-        FROM opportunities o
-        WHERE o.id = NEW.opportunity_id;
+        INSERT INTO opportunities_fts (
+            rowid, notice_id, title, agency, sub_tier, office, notice_type, status,
+            naics_codes, set_aside
+        ) VALUES (
+            NEW.id, NEW.notice_id, NEW.title, NEW.agency, NEW.sub_tier, NEW.office,
+            NEW.notice_type, NEW.status, NEW.naics_codes, NEW.set_aside
+        );
     END;
     """,
     """
-    CREATE TRIGGER IF NOT EXISTS descriptions_ad AFTER DELETE ON descriptions
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_ad AFTER DELETE ON opportunities
     BEGIN
-        DELETE FROM opportunity_search WHERE rowid = OLD.opportunity_id;
+        INSERT INTO opportunities_fts (
+            opportunities_fts, rowid, notice_id, title, agency, sub_tier, office,
+            notice_type, status, naics_codes, set_aside
+        ) VALUES (
+            'delete', OLD.id, OLD.notice_id, OLD.title, OLD.agency, OLD.sub_tier,
+            OLD.office, OLD.notice_type, OLD.status, OLD.naics_codes, OLD.set_aside
+        );
     END;
     """,
+    """
+    CREATE TRIGGER IF NOT EXISTS opportunities_fts_au AFTER UPDATE ON opportunities
+    WHEN OLD.notice_id IS NOT NEW.notice_id
+        OR OLD.title IS NOT NEW.title
+        OR OLD.agency IS NOT NEW.agency
+        OR OLD.sub_tier IS NOT NEW.sub_tier
+        OR OLD.office IS NOT NEW.office
+        OR OLD.notice_type IS NOT NEW.notice_type
+        OR OLD.status IS NOT NEW.status
+        OR OLD.naics_codes IS NOT NEW.naics_codes
+        OR OLD.set_aside IS NOT NEW.set_aside
+    BEGIN
+        INSERT INTO opportunities_fts (
+            opportunities_fts, rowid, notice_id, title, agency, sub_tier, office,
+            notice_type, status, naics_codes, set_aside
+        ) VALUES (
+            'delete', OLD.id, OLD.notice_id, OLD.title, OLD.agency, OLD.sub_tier,
+            OLD.office, OLD.notice_type, OLD.status, OLD.naics_codes, OLD.set_aside
+        );
+        INSERT INTO opportunities_fts (
+            rowid, notice_id, title, agency, sub_tier, office, notice_type, status,
+            naics_codes, set_aside
+        ) VALUES (
+            NEW.id, NEW.notice_id, NEW.title, NEW.agency, NEW.sub_tier, NEW.office,
+            NEW.notice_type, NEW.status, NEW.naics_codes, NEW.set_aside
+        );
+    END;
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rule_registry (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL DEFAULT 0
+    );
+    """,
+    """
+    INSERT OR IGNORE INTO rule_registry (id, version) VALUES (1, 0);
+    """,
+    *(
+        f"""
+    CREATE TRIGGER IF NOT EXISTS {table}_registry_{suffix} AFTER {event} ON {table}
+    BEGIN
+        UPDATE rule_registry SET version = version + 1 WHERE id = 1;
+    END;
+    """
+        for table in ("rules", "alerts")
+        for suffix, event in (("ai", "INSERT"), ("au", "UPDATE"), ("ad", "DELETE"))
+    ),
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS opportunity_search USING fts5(title, agency, body);
+    """,
+)
+
+
+# Parameters follow the column list below. last_changed_at only moves when the
+# digest differs from the stored one.
+OPPORTUNITY_UPSERT_SQL = """
+    INSERT INTO opportunities (
+        notice_id, title, agency, sub_tier, office, notice_type, status,
+        posted_at, updated_at, response_deadline, naics_codes,
+        set_aside, digest, last_changed_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(notice_id) DO UPDATE SET
+        title=excluded.title,
+        agency=excluded.agency,
+        sub_tier=excluded.sub_tier,
+        office=excluded.office,
+        notice_type=excluded.notice_type,
+        status=excluded.status,
+        posted_at=excluded.posted_at,
+        updated_at=excluded.updated_at,
+        response_deadline=excluded.response_deadline,
+        naics_codes=excluded.naics_codes,
+        set_aside=excluded.set_aside,
+        digest=excluded.digest,
+        last_seen_at=CURRENT_TIMESTAMP,
+        last_changed_at=CASE
+            WHEN excluded.digest IS NOT opportunities.digest THEN CURRENT_TIMESTAMP
+            ELSE opportunities.last_changed_at
+        END
+"""
+
+# opportunity_search is maintained in bulk by Database.refresh_search_index after
+# each ingest batch instead of by per-row triggers on descriptions.
+_SEARCH_INDEX_SQL = """
+    INSERT INTO opportunity_search (rowid, title, agency, body)
+    SELECT d.opportunity_id, o.title, o.agency, d.body
+    FROM descriptions d
+    JOIN opportunities o ON o.id = d.opportunity_id
+"""
+_SEARCH_INDEX_CHUNK = 896
+
+# Fills opportunity_naics from the comma-separated naics_codes column of databases
+# created before the table existed, by rewriting each list as a JSON array for json_each.
+_NAICS_BACKFILL_SQL = """
+    WITH codes(id, array) AS (
+        SELECT id, '["' || replace(naics_codes, ',', '","') || '"]'
+        FROM opportunities
+        WHERE naics_codes <> ''
+    )
+    INSERT OR IGNORE INTO opportunity_naics (code, opportunity_id)
+    SELECT trim(j.value), codes.id
+    FROM codes, json_each(CASE WHEN json_valid(codes.array) THEN codes.array END) j
+    WHERE trim(j.value) <> ''
+"""
+
+_CONNECTION_PRAGMAS: Sequence[str] = (
+    # Only takes effect while the file is still empty, so it must run before journal_mode
+    # writes the header. 16 KiB pages hold four times the keys of the 4 KiB default per
+    # B-tree node, keeping the opportunity and FTS trees a level shallower. Existing
+    # databases keep their page size until a VACUUM.
+    "PRAGMA page_size = 16384",
+    "PRAGMA foreign_keys = ON",
+    # WAL lets rule workers read while the writer commits; NORMAL only fsyncs at
+    # checkpoints, which is durable enough for a cache of SAM.gov data.
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    # Serve reads from the OS page cache via a 256 MiB mapping and keep a 64 MiB page
+    # cache, so FTS and index lookups rarely go back to read().
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+)
+
+# WAL growth between automatic checkpoints. wal_autocheckpoint counts pages, so
+# Database.connect converts this using the file's actual page size: databases created
+# before page_size was raised to 16 KiB keep 4 KiB pages.
+_WAL_CHECKPOINT_BYTES = 8 << 20
+
+
+def _connection_pragmas(durable: bool) -> tuple[str, ...]:
+    """Return the per-connection PRAGMAs, fsyncing every commit when ``durable``."""
+
+    if not durable:
+        return tuple(_CONNECTION_PRAGMAS)
+    return tuple(
+        "PRAGMA synchronous = FULL" if pragma == "PRAGMA synchronous = NORMAL" else pragma
+        for pragma in _CONNECTION_PRAGMAS
+    )
+
+
+# Added by Database.tune_for_ingest: a 256 MiB page cache for the bulk upserts and a
+# ~40 MiB WAL between checkpoints so long sweeps checkpoint less often.
+_INGEST_PRAGMAS: Sequence[str] = ("PRAGMA cache_size = -262144",)
+_INGEST_WAL_CHECKPOINT_BYTES = 40 << 20
+
+# Applied as one script inside one transaction instead of statement by statement.
+# SCHEMA_STATEMENTS stays available for introspection.
+_SCHEMA_SQL: Final[str] = (
+    "BEGIN;\n"
+    + ";\n".join(statement.strip().rstrip(";") for statement in SCHEMA_STATEMENTS)
+    + ";\nCOMMIT;"
 )
 
+# Room for the schema, upsert, FTS and metric statements of a busy ingest without
+# evicting prepared statements from sqlite3's per-connection LRU (default 128).
+_CACHED_STATEMENTS = 512
+
+_SQL_INSERT_RUN: Final[str] = """
+    INSERT INTO runs (kind, started_at, status)
+    VALUES (?, ?, ?)
+    RETURNING id
+"""
+_SQL_UPDATE_RUN: Final[str] = """
+    UPDATE runs
+    SET status = ?, finished_at = ?, error_message = ?
+    WHERE id = ?
+"""
+_SQL_INSERT_METRIC: Final[str] = """
+    INSERT INTO run_metrics (run_id, metric, value)
+    VALUES (?, ?, ?)
+"""
+
+# IN lists are padded to a multiple of this so only a handful of distinct statement
+# texts reach SQLite, keeping the per-connection prepared statement cache warm.
+_IN_CLAUSE_BUCKET = 16
+
+
+@lru_cache(maxsize=64)
+def _placeholders(count: int) -> str:
+    return ",".join("?" * count)
+
+
+def in_clause(values: Sequence[object]) -> tuple[str, list[object]]:
+    """Return ``IN`` list placeholders and parameters for ``values``.
+
+    The parameters are padded by repeating the last value, which leaves the
+    membership test unchanged.
+    """
+
+    parameters = list(values)
+    remainder = len(parameters) % _IN_CLAUSE_BUCKET
+    if remainder:
+        parameters.extend([parameters[-1]] * (_IN_CLAUSE_BUCKET - remainder))
+    return _placeholders(len(parameters)), parameters
+
+
+# Multi-row INSERTs stay below SQLite's default limit of 999 bound parameters.
+_MAX_INSERT_PARAMETERS = 900
+
+
+@lru_cache(maxsize=128)
+def _insert_sql(table: str, columns: tuple[str, ...], rows: int) -> str:
+    row = f"({_placeholders(len(columns))})"
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES {','.join([row] * rows)}"
+
+
+def insert_rows(
+    cur: sqlite3.Cursor,
+    table: str,
+    columns: tuple[str, ...],
+    rows: Sequence[Sequence[object]],
+) -> None:
+    """Insert ``rows`` with multi-row ``VALUES`` statements, chunked by parameter count."""
+
+    per_statement = _MAX_INSERT_PARAMETERS // len(columns)
+    for start in range(0, len(rows), per_statement):
+        chunk = rows[start : start + per_statement]
+        cur.execute(
+            _insert_sql(table, columns, len(chunk)),
+            [value for row in chunk for value in row],
+        )
+
 
 class Database:
     """Convenience wrapper around :mod:`sqlite3` with schema helpers."""
 
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, durable: bool = False) -> None:
         self.path = path
         self._connection: sqlite3.Connection | None = None
+        self._transaction_depth = 0
+        self._connection_pragmas = _connection_pragmas(durable)
+        self._pragmas = self._connection_pragmas
+        self._wal_checkpoint_bytes = _WAL_CHECKPOINT_BYTES
 
-    @staticmethod
-    def _timestamp() -> str:
-        """Return a UTC timestamp in ISO 8601 format."""
-
-        return (
-            datetime.now(UTC)
-            .replace(microsecond=0)
-            .isoformat()
-            .replace("+00:00", "Z")
+    # (epoch second, formatted string) of the last _timestamp() call; replaced as a
+    # whole tuple so concurrent readers never see a torn pair.
+    _timestamp_cache: tuple[int, str] = (-1, "")
+
+    @classmethod
+    def _timestamp(cls) -> str:
+        """Return a UTC timestamp in ISO 8601 format, truncated to whole seconds."""
+
+        now = int(time.time())
+        cached_second, cached = cls._timestamp_cache
+        if now == cached_second:
+            return cached
+        t = time.gmtime(now)
+        formatted = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}Z"
         )
+        cls._timestamp_cache = (now, formatted)
+        return formatted
 
     def connect(self) -> sqlite3.Connection:
         if self._connection is None:
             self.path.parent.mkdir(parents=True, exist_ok=True)
-            self._connection = sqlite3.connect(self.path)
+            # Autocommit mode: the sqlite3 module never opens implicit transactions, so
+            # writes are grouped only where transaction() is used.
+            self._connection = sqlite3.connect(
+                self.path, isolation_level=None, cached_statements=_CACHED_STATEMENTS
+            )
             self._connection.row_factory = sqlite3.Row
+            for pragma in self._pragmas:
+                self._connection.execute(pragma)
+            self._apply_wal_autocheckpoint(self._connection)
         return self._connection
 
+    def _apply_wal_autocheckpoint(self, conn: sqlite3.Connection) -> None:
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        conn.execute(
+            f"PRAGMA wal_autocheckpoint = {max(1, self._wal_checkpoint_bytes // page_size)}"
+        )
+
+    def tune_for_ingest(self) -> None:
+        """Apply the larger cache and checkpoint interval used by ingestion sweeps.
+
+        The settings are kept for connections reopened after :meth:`close`.
+        """
+
+        self._pragmas = (*self._connection_pragmas, *_INGEST_PRAGMAS)
+        self._wal_checkpoint_bytes = _INGEST_WAL_CHECKPOINT_BYTES
+        if self._connection is not None:
+            for pragma in _INGEST_PRAGMAS:
+                self._connection.execute(pragma)
+            self._apply_wal_autocheckpoint(self._connection)
+
+    def checkpoint(self) -> None:
+        """Copy the WAL into the main file and truncate it to zero bytes.
+
+        Ingestion sweeps checkpoint rarely while writing (see :meth:`tune_for_ingest`),
+        so the WAL is folded in once at the end of a run instead.
+        """
+
+        self.connect().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
     @property
     def connection(self) -> sqlite3.Connection:
         return self.connect()
@@ -185,44 +496,172 @@ class Database:
 
     def initialize_schema(self) -> None:
         conn = self.connect()
-        with conn:
-            for statement in SCHEMA_STATEMENTS:
-                conn.execute(statement)
+        fts_missing = (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'opportunities_fts'"
+            ).fetchone()
+            is None
+        )
+        naics_missing = (
+            conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'opportunity_naics'"
+            ).fetchone()
+            is None
+        )
+        search_row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE name = 'opportunity_search'"
+        ).fetchone()
+        search_missing = search_row is None or "content=" in search_row[0]
+        if search_row is not None and search_missing:
+            # Older databases declared opportunity_search as an external-content table
+            # over descriptions, which lacks the title/agency columns it indexes.
+            with self.transaction() as cur:
+                cur.execute("DROP TRIGGER IF EXISTS descriptions_ai")
+                cur.execute("DROP TRIGGER IF EXISTS descriptions_ad")
+                cur.execute("DROP TABLE opportunity_search")
+        try:
+            conn.executescript(_SCHEMA_SQL)
+        except sqlite3.Error:
+            # A failing statement stops the script inside its BEGIN.
+            conn.rollback()
+            raise
+        with self.transaction():
+            if fts_missing:
+                # Index rows that predate the opportunities_fts table.
+                conn.execute("INSERT INTO opportunities_fts (opportunities_fts) VALUES ('rebuild')")
+            if naics_missing:
+                conn.execute(_NAICS_BACKFILL_SQL)
+            self._ensure_column(conn, "rule_matches", "payload_hash", "TEXT")
+            if search_missing:
+                self.refresh_search_index()
+        # Gathers planner statistics only for tables and indexes that need them, unlike
+        # a full ANALYZE, so it stays cheap on every startup.
+        conn.execute("PRAGMA optimize")
+
+    @staticmethod
+    def _ensure_column(
+        conn: sqlite3.Connection, table: str, column: str, definition: str
+    ) -> None:
+        """Add ``column`` to ``table`` in databases created before it existed."""
+
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    def open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for use on another thread; the caller closes it.
+
+        :mod:`sqlite3` connections cannot be shared across threads, so worker threads
+        get their own connection instead of the shared :attr:`connection`. The thread
+        check is disabled so the owner can close it once its worker has exited.
+        """
+
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        return conn
 
     @contextmanager
-    def cursor(self) -> Iterator[sqlite3.Cursor]:
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Open a short-lived read-only connection for use on another thread."""
+
+        conn = self.open_reader()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run the enclosed statements in a single ``BEGIN IMMEDIATE`` transaction.
+
+        Nested calls, as well as :meth:`cursor` and :meth:`execute` used inside the
+        block, join the outer transaction instead of committing on their own. Outside a
+        transaction the connection is in autocommit mode.
+        """
+
         conn = self.connect()
         cur = conn.cursor()
+        outermost = self._transaction_depth == 0
+        if outermost:
+            cur.execute("BEGIN IMMEDIATE")
+        self._transaction_depth += 1
+        try:
+            yield cur
+        except BaseException:
+            if outermost:
+                conn.rollback()
+            raise
+        else:
+            if outermost:
+                conn.commit()
+        finally:
+            self._transaction_depth -= 1
+            cur.close()
+
+    @contextmanager
+    def cursor(self) -> Iterator[sqlite3.Cursor]:
+        """Yield a cursor on the shared connection, closed when the block exits.
+
+        No transaction is opened, so reads don't take the write lock: statements
+        autocommit, or join a :meth:`transaction` that is already open. Use
+        :meth:`transaction` for writes that must commit together.
+        """
+
+        cur = self.connect().cursor()
         try:
             yield cur
-            conn.commit()
         finally:
             cur.close()
 
     def executemany(self, sql: str, seq_of_parameters: Iterable[Iterable[object]]) -> None:
-        with self.cursor() as cur:
+        with self.transaction() as cur:
             cur.executemany(sql, seq_of_parameters)
 
     def execute(self, sql: str, parameters: Iterable[object] | None = None) -> sqlite3.Cursor:
+        """Execute one statement, autocommitting unless a transaction is open."""
+
         conn = self.connect()
-        cur = conn.execute(sql, tuple(parameters or ()))
-        conn.commit()
-        return cur
+        if parameters is None:
+            return conn.execute(sql)
+        if not isinstance(parameters, tuple | list):
+            # sqlite3 binds any sequence directly; only copy other iterables.
+            parameters = tuple(parameters)
+        return conn.execute(sql, parameters)
+
+    def refresh_search_index(self, opportunity_ids: Iterable[int] | None = None) -> None:
+        """Re-index opportunity descriptions in ``opportunity_search``.
+
+        Pass the ids written by an ingest batch to re-index just those rows, or
+        ``None`` to rebuild the whole index.
+        """
+
+        with self.transaction() as cur:
+            if opportunity_ids is None:
+                cur.execute("DELETE FROM opportunity_search")
+                cur.execute(_SEARCH_INDEX_SQL)
+                return
+            ids = list(dict.fromkeys(opportunity_ids))
+            for start in range(0, len(ids), _SEARCH_INDEX_CHUNK):
+                placeholders, parameters = in_clause(ids[start : start + _SEARCH_INDEX_CHUNK])
+                cur.execute(
+                    f"DELETE FROM opportunity_search WHERE rowid IN ({placeholders})",
+                    parameters,
+                )
+                cur.execute(
+                    f"{_SEARCH_INDEX_SQL} WHERE d.opportunity_id IN ({placeholders})",
+                    parameters,
+                )
 
     @contextmanager
     def record_run(self, kind: str) -> Iterator[int]:
         """Context manager that records a run in the ``runs`` table."""
 
         started_at = self._timestamp()
-        with self.cursor() as cur:
-            cur.execute(
-                """
-                INSERT INTO runs (kind, started_at, status)
-                VALUES (?, ?, ?)
-                """,
-                (kind, started_at, "running"),
-            )
-            run_id = int(cur.lastrowid)
+        with self.transaction() as cur:
+            cur.execute(_SQL_INSERT_RUN, (kind, started_at, "running"))
+            run_id = int(cur.fetchone()[0])
         try:
             yield run_id
         except Exception as exc:  # pragma: no cover - defensive logging
@@ -238,31 +677,21 @@ class Database:
         status: str,
         error_message: str | None = None,
     ) -> None:
-        with self.cursor() as cur:
+        with self.transaction() as cur:
             cur.execute(
-                """
-                UPDATE runs
-                SET status = ?, finished_at = ?, error_message = ?
-                WHERE id = ?
-                """,
-                (status, self._timestamp(), error_message, run_id),
+                _SQL_UPDATE_RUN, (status, self._timestamp(), error_message, run_id)
             )
 
     def record_run_metrics(self, run_id: int, metrics: Mapping[str, int]) -> None:
         """Persist aggregated metrics for a completed run."""
 
-        rows = [
+        rows = (
             (run_id, key, int(value))
             for key, value in metrics.items()
             if value is not None
-        ]
-        if not rows:
+        )
+        first = next(rows, None)
+        if first is None:
             return
-        with self.cursor() as cur:
-            cur.executemany(
-                """
-                INSERT INTO run_metrics (run_id, metric, value)
-                VALUES (?, ?, ?)
-                """,
-                rows,
-            )
+        with self.transaction() as cur:
+            cur.executemany(_SQL_INSERT_METRIC, chain((first,), rows))
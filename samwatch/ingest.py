@@ -3,27 +3,163 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable, Mapping
-from dataclasses import dataclass
+import os
+import posixpath
+import queue
+import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from itertools import islice
 from pathlib import Path
 from urllib.parse import urlparse
 
-from .client import SAMClientError, SAMWatchClient
+from .client import AttachmentDownload, SAMClientError, SAMWatchClient
 from .config import Config
-from .db import Database
+from .db import OPPORTUNITY_UPSERT_SQL, Database, in_clause, insert_rows
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
 class UpsertOutcome:
     """Summary information about processing a single record."""
 
+    opportunity_id: int | None = None
     created: bool = False
     updated: bool = False
     attachments_downloaded: int = 0
     attachment_failures: int = 0
+    unchanged: bool = False
 
-logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
+class PrefetchedRecord:
+    """Network results gathered for a record before its write transaction."""
+
+    attachments: list[_AttachmentResult] = field(default_factory=list)
+    description: str | None = None
+
+
+_COMMIT_BATCH_SIZE = 100
+# Keeps notice_id IN (...) lookups below SQLite's 999 bound parameter limit.
+_LOOKUP_CHUNK = 896
+# Record keys bound to OPPORTUNITY_UPSERT_SQL, in statement order. The categorical ones
+# repeat a small set of values across a sweep and are interned (see _intern).
+_CATEGORICAL_FIELDS = ("agency", "subTier", "office", "type", "status")
+_DATE_FIELDS = ("postedDate", "updatedDate", "responseDate")
+
+
+def _intern(value: object) -> object:
+    """Return the interned copy of string ``value``, so repeats share one object."""
+
+    return sys.intern(value) if type(value) is str else value
+
+
+# Characters that are path separators or invalid in Windows file names.
+_UNSAFE_PATH_CHARS = str.maketrans(dict.fromkeys('/\\:*?"<>|\0', "_"))
+
+
+def _safe_path_component(name: str) -> str:
+    """Make an API-supplied notice id or file name safe to use as one path segment."""
+
+    name = name.translate(_UNSAFE_PATH_CHARS)
+    return "_" if name in {"", ".", ".."} else name
+
+
+_DESCRIPTION_URL_KEYS = ("descriptionUrl", "descriptionLink", "noticeDescriptionUrl")
+
+# Batch statements, with "{}" standing for the placeholders of an in_clause() list.
+_SQL_LOOKUP_OPPORTUNITIES = (
+    "SELECT id, notice_id, digest FROM opportunities WHERE notice_id IN ({})"
+)
+_SQL_TOUCH_OPPORTUNITIES = (
+    "UPDATE opportunities SET last_seen_at = CURRENT_TIMESTAMP WHERE id IN ({})"
+)
+_SQL_STORED_ATTACHMENTS = (
+    "SELECT opportunity_id, url, sha256, local_path, bytes FROM attachments"
+    " WHERE opportunity_id IN ({}) AND sha256 IS NOT NULL"
+)
+_SQL_DELETE_CHILDREN = {
+    table: f"DELETE FROM {table} WHERE opportunity_id IN ({{}})"
+    for table in ("awards", "contacts", "attachments", "descriptions", "opportunity_naics")
+}
+
+# (url, destination, resource link, download result or the exception it raised). The
+# result is None when the stored copy was kept; the link then holds its sha256 and size.
+_AttachmentResult = tuple[
+    str, Path, Mapping[str, object], AttachmentDownload | BaseException | None
+]
+
+_AWARD_COLUMNS = (
+    "opportunity_id",
+    "award_type",
+    "date",
+    "description",
+    "amount",
+    "vendor_name",
+    "vendor_duns",
+)
+_CONTACT_COLUMNS = ("opportunity_id", "name", "type", "email", "phone")
+_ATTACHMENT_COLUMNS = ("opportunity_id", "url", "local_path", "sha256", "bytes")
+# Search results buffered ahead of the batch writer by _prefetched.
+_PREFETCH_RECORDS = 1000
+
+
+@dataclass(slots=True)
+class _EndOfStream:
+    error: BaseException | None = None
+
+
+def _prefetched(items: Iterable[object], maxsize: int = _PREFETCH_RECORDS) -> Iterator[object]:
+    """Yield ``items`` while a background thread keeps up to ``maxsize`` of them buffered.
+
+    Lets SAM.gov pagination continue while the consumer is committing a batch. Errors
+    raised by ``items`` are re-raised in the consumer.
+    """
+
+    buffer: queue.Queue[object] = queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def produce() -> None:
+        iterator = iter(items)
+        try:
+            for item in iterator:
+                if not put(item):
+                    return
+        except BaseException as exc:
+            put(_EndOfStream(exc))
+        else:
+            put(_EndOfStream())
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, name="samwatch-prefetch", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, _EndOfStream):
+                if item.error is not None:
+                    raise item.error
+                return
+            yield item
+    finally:
+        stop.set()
 
 
 class IngestionOrchestrator:
@@ -33,6 +169,7 @@ class IngestionOrchestrator:
         self.config = config
         self.client = client
         self.database = database
+        self.database.tune_for_ingest()
 
     def run_hot(self) -> None:
         """Scan the current day for new or updated notices."""
@@ -71,130 +208,234 @@ class IngestionOrchestrator:
 
     def _ingest_range(self, kind: str, params: Mapping[str, object]) -> None:
         logger.info("Starting %s ingestion with params %s", kind, params)
-        metrics = {
-            "records_processed": 0,
-            "records_created": 0,
-            "records_updated": 0,
-            "attachments_downloaded": 0,
-            "attachment_failures": 0,
-        }
+        processed = created = updated = downloaded = failed = 0
         run_id = None
         with self.database.record_run(kind) as current_run_id:
             run_id = current_run_id
-            for record in self.client.iter_search(params):
-                outcome = self.upsert_record(record)
-                metrics["records_processed"] += 1
-                if outcome.created:
-                    metrics["records_created"] += 1
-                if outcome.updated:
-                    metrics["records_updated"] += 1
-                metrics["attachments_downloaded"] += outcome.attachments_downloaded
-                metrics["attachment_failures"] += outcome.attachment_failures
+            records = _prefetched(self.client.iter_search(params))
+            # Commit once per batch rather than once per record. Search pages are pulled
+            # on a background thread, and attachments and descriptions are fetched before
+            # the batch's transaction opens, so the write lock isn't held across network
+            # I/O.
+            while batch := list(islice(records, _COMMIT_BATCH_SIZE)):
+                outcomes = self.write_batch(batch)
+                processed += len(outcomes)
+                for outcome in outcomes:
+                    created += outcome.created
+                    updated += outcome.updated
+                    downloaded += outcome.attachments_downloaded
+                    failed += outcome.attachment_failures
+        metrics = {
+            "records_processed": processed,
+            "records_created": created,
+            "records_updated": updated,
+            "attachments_downloaded": downloaded,
+            "attachment_failures": failed,
+        }
         if run_id is not None:
             self.database.record_run_metrics(run_id, metrics)
+        self.database.checkpoint()
         logger.info(
             "Completed %s ingestion run %s; processed %d records (created=%d updated=%d)",
             kind,
             run_id,
-            metrics["records_processed"],
-            metrics["records_created"],
-            metrics["records_updated"],
+            processed,
+            created,
+            updated,
         )
 
+    def write_batch(self, records: Sequence[Mapping[str, object]]) -> list[UpsertOutcome]:
+        """Prefetch and upsert ``records`` as one committed transaction."""
+
+        return self.upsert_records(records, self.prefetch(records))
+
     def upsert_record(self, record: Mapping[str, object]) -> UpsertOutcome:
         """Persist a single API record into the database."""
 
-        outcome = UpsertOutcome()
-        notice_id = str(record.get("noticeId"))
-        logger.debug("Processing notice %s", notice_id)
-        naics = record.get("naics", []) or []
-        if isinstance(naics, str):
-            naics_codes = naics
-        else:
-            naics_codes = ",".join(str(code) for code in naics)
+        return self.upsert_records([record])[0]
 
-        with self.database.cursor() as cur:
-            cur.execute(
-                "SELECT id, digest FROM opportunities WHERE notice_id = ?",
-                (notice_id,),
+    def upsert_records(
+        self,
+        records: Sequence[Mapping[str, object]],
+        prefetched: Sequence[PrefetchedRecord | None] | None = None,
+    ) -> list[UpsertOutcome]:
+        """Persist a batch of API records, returning one outcome per record in order.
+
+        Existing rows are preloaded with one lookup. Records whose digest matches the
+        stored one only have ``last_seen_at`` bumped; the rest are written with a single
+        ``executemany``, and their child rows cleared with one ``DELETE`` per table and
+        re-inserted, and their ``opportunity_search`` entries refreshed. ``prefetched`` is
+        the result of :meth:`prefetch` for ``records``; it is computed here when omitted.
+        """
+
+        if prefetched is None:
+            prefetched = self.prefetch(records)
+        notice_ids = [str(record.get("noticeId")) for record in records]
+        with self.database.transaction() as cur:
+            found = self._lookup_opportunities(cur, notice_ids)
+            outcomes, latest = self._plan_writes(notice_ids, records, found)
+            # sqlite3 pulls the parameter rows from the generator as it steps the statement,
+            # so the batch's bind tuples are never held in a list.
+            cur.executemany(
+                OPPORTUNITY_UPSERT_SQL,
+                (self._opportunity_params(key, records[index]) for key, index in latest.items()),
             )
-            existing = cur.fetchone()
-            existing_id = existing[0] if existing else None
-            existing_digest = existing[1] if existing else None
-
-            cur.execute(
-                """
-                INSERT INTO opportunities (
-                    notice_id, title, agency, sub_tier, office, notice_type, status,
-                    posted_at, updated_at, response_deadline, naics_codes,
-                    set_aside, digest, last_changed_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(notice_id) DO UPDATE SET
-                    title=excluded.title,
-                    agency=excluded.agency,
-                    sub_tier=excluded.sub_tier,
-                    office=excluded.office,
-                    notice_type=excluded.notice_type,
-                    status=excluded.status,
-                    posted_at=excluded.posted_at,
-                    updated_at=excluded.updated_at,
-                    response_deadline=excluded.response_deadline,
-                    naics_codes=excluded.naics_codes,
-                    set_aside=excluded.set_aside,
-                    digest=excluded.digest,
-                    last_seen_at=CURRENT_TIMESTAMP,
-                    last_changed_at=CASE
-                        WHEN excluded.digest IS NOT opportunities.digest THEN CURRENT_TIMESTAMP
-                        ELSE opportunities.last_changed_at
-                    END
-                ;
-                """,
-                (
-                    notice_id,
-                    record.get("title"),
-                    record.get("agency"),
-                    record.get("subTier"),
-                    record.get("office"),
-                    record.get("type"),
-                    record.get("status"),
-                    record.get("postedDate"),
-                    record.get("updatedDate"),
-                    record.get("responseDate"),
-                    naics_codes,
-                    record.get("setAside"),
-                    record.get("digest"),
-                    record.get("lastModified"),
-                ),
+            self._execute_in(
+                cur,
+                _SQL_TOUCH_OPPORTUNITIES,
+                [found[key][0] for key in dict.fromkeys(notice_ids) if key not in latest],
             )
 
-            cur.execute("SELECT id FROM opportunities WHERE notice_id = ?", (notice_id,))
-            row = cur.fetchone()
-            if row is None:
-                return outcome
-            opportunity_id = row[0]
-
-            cur.execute(
-                "SELECT digest FROM opportunities WHERE id = ?",
-                (opportunity_id,),
+            # Existing rows keep their id through the upsert, so only notices inserted by
+            # this batch need their new ids looked up.
+            ids = {key: row[0] for key, row in found.items()}
+            created = [key for key in latest if key not in ids]
+            if created:
+                ids.update(
+                    (key, row[0]) for key, row in self._lookup_opportunities(cur, created).items()
+                )
+            for outcome, notice_id in zip(outcomes, notice_ids, strict=True):
+                outcome.opportunity_id = ids[notice_id]
+
+            # Records that prefetch() expected to be unchanged keep their stored
+            # attachments and description rather than having them cleared.
+            written = [ids[key] for key in latest]
+            self._execute_in(cur, _SQL_DELETE_CHILDREN["awards"], written)
+            self._execute_in(cur, _SQL_DELETE_CHILDREN["contacts"], written)
+            self._execute_in(cur, _SQL_DELETE_CHILDREN["opportunity_naics"], written)
+            self._execute_in(
+                cur,
+                _SQL_DELETE_CHILDREN["attachments"],
+                [ids[key] for key, index in latest.items() if prefetched[index] is not None],
             )
-            digest_row = cur.fetchone()
-            current_digest = digest_row[0] if digest_row else None
-            outcome.created = existing_id is None
-            outcome.updated = bool(existing_id is not None and current_digest != existing_digest)
-
-            self._persist_awards(cur, opportunity_id, record.get("awards") or record.get("award"))
-            self._persist_contacts(cur, opportunity_id, record.get("contacts", []))
-            self._persist_description(cur, opportunity_id, record)
-            downloaded, failed = self._persist_attachments(
+            descriptions: list[tuple[int, str]] = []
+            naics: list[tuple[str, int]] = []
+            for notice_id, index in latest.items():
+                record = records[index]
+                outcome = outcomes[index]
+                opportunity_id = ids[notice_id]
+                naics.extend(
+                    (code, opportunity_id) for code in self._naics_codes(record.get("naics"))
+                )
+                self._persist_awards(
+                    cur, opportunity_id, record.get("awards") or record.get("award")
+                )
+                self._persist_contacts(cur, opportunity_id, record.get("contacts", []))
+                fetched = prefetched[index]
+                if fetched is None:
+                    continue
+                if fetched.description is not None:
+                    descriptions.append((opportunity_id, fetched.description))
+                downloaded, failed = self._persist_attachments(
+                    cur, opportunity_id, fetched.attachments
+                )
+                outcome.attachments_downloaded = downloaded
+                outcome.attachment_failures = failed
+
+            # Notices without description text keep the body stored previously.
+            self._execute_in(
                 cur,
-                opportunity_id,
-                notice_id,
-                record.get("resourceLinks", []),
+                _SQL_DELETE_CHILDREN["descriptions"],
+                [row[0] for row in descriptions],
             )
-            outcome.attachments_downloaded = downloaded
-            outcome.attachment_failures = failed
-
-        return outcome
+            insert_rows(cur, "descriptions", ("opportunity_id", "body"), descriptions)
+            insert_rows(cur, "opportunity_naics", ("code", "opportunity_id"), naics)
+            self.database.refresh_search_index(written)
+
+        return outcomes
+
+    @staticmethod
+    def _plan_writes(
+        notice_ids: Sequence[str],
+        records: Sequence[Mapping[str, object]],
+        found: Mapping[str, tuple[int, object]],
+    ) -> tuple[list[UpsertOutcome], dict[str, int]]:
+        """Classify ``records`` against the stored digests in ``found``.
+
+        Returns an outcome per record and, for each notice that needs writing, the index
+        of its last changed record. A record is unchanged when its digest equals the one
+        stored, or the one of an earlier record for the same notice in this batch.
+        """
+
+        digests = {key: row[1] for key, row in found.items()}
+        outcomes: list[UpsertOutcome] = []
+        latest: dict[str, int] = {}
+        for index, (notice_id, record) in enumerate(zip(notice_ids, records, strict=True)):
+            digest = record.get("digest")
+            outcome = UpsertOutcome(created=notice_id not in digests)
+            outcomes.append(outcome)
+            if not outcome.created:
+                stored = digests[notice_id]
+                if digest is not None and digest == stored:
+                    outcome.unchanged = True
+                    continue
+                outcome.updated = digest != stored
+            digests[notice_id] = digest
+            latest[notice_id] = index
+        return outcomes, latest
+
+    @staticmethod
+    def _lookup_opportunities(cur, notice_ids: Sequence[str]) -> dict[str, tuple[int, object]]:
+        found: dict[str, tuple[int, object]] = {}
+        unique_ids = list(dict.fromkeys(notice_ids))
+        for start in range(0, len(unique_ids), _LOOKUP_CHUNK):
+            placeholders, parameters = in_clause(unique_ids[start : start + _LOOKUP_CHUNK])
+            cur.execute(_SQL_LOOKUP_OPPORTUNITIES.format(placeholders), parameters)
+            found.update((row[1], (row[0], row[2])) for row in cur.fetchall())
+        return found
+
+    @staticmethod
+    def _stored_attachments(
+        cur, opportunity_ids: Sequence[int]
+    ) -> dict[tuple[int, str], tuple[str, str, int | None]]:
+        """Map ``(opportunity_id, url)`` to the stored ``(sha256, local_path, bytes)``."""
+
+        stored: dict[tuple[int, str], tuple[str, str, int | None]] = {}
+        for start in range(0, len(opportunity_ids), _LOOKUP_CHUNK):
+            placeholders, parameters = in_clause(opportunity_ids[start : start + _LOOKUP_CHUNK])
+            cur.execute(_SQL_STORED_ATTACHMENTS.format(placeholders), parameters)
+            stored.update(((row[0], row[1]), (row[2], row[3], row[4])) for row in cur)
+        return stored
+
+    @staticmethod
+    def _execute_in(cur, sql: str, values: Sequence[object]) -> None:
+        """Run ``sql`` with its ``IN ({})`` list bound to ``values``, in chunks."""
+
+        for start in range(0, len(values), _LOOKUP_CHUNK):
+            placeholders, parameters = in_clause(values[start : start + _LOOKUP_CHUNK])
+            cur.execute(sql.format(placeholders), parameters)
+
+    @staticmethod
+    def _naics_codes(naics: object) -> Iterable[str]:
+        """Return the distinct NAICS codes of a record for ``opportunity_naics``."""
+
+        if not naics:
+            return ()
+        codes = naics.split(",") if isinstance(naics, str) else map(str, naics)
+        return dict.fromkeys(code for code in map(str.strip, codes) if code)
+
+    @staticmethod
+    def _opportunity_params(notice_id: str, record: Mapping[str, object]) -> tuple[object, ...]:
+        naics = record.get("naics", []) or []
+        if isinstance(naics, str):
+            naics_codes = naics
+        else:
+            try:
+                # SAM.gov sends the codes as strings; join them without converting.
+                naics_codes = ",".join(naics)
+            except TypeError:
+                naics_codes = ",".join(map(str, naics))
+        get = record.get
+        return (
+            notice_id,
+            get("title"),
+            *map(_intern, map(get, _CATEGORICAL_FIELDS)),
+            *map(get, _DATE_FIELDS),
+            naics_codes,
+            _intern(get("setAside")),
+            get("digest"),
+            get("lastModified"),
+        )
 
     def _persist_awards(
         self,
@@ -202,24 +443,26 @@ class IngestionOrchestrator:
         opportunity_id: int,
         awards: object,
     ) -> None:
-        cur.execute("DELETE FROM awards WHERE opportunity_id = ?", (opportunity_id,))
         if not awards:
             return
 
-        if isinstance(awards, Mapping):
+        # SAM.gov sends a list of plain dicts; test for that before the slower ABC checks.
+        if type(awards) is list:
+            award_iterable = [
+                entry for entry in awards if type(entry) is dict or isinstance(entry, Mapping)
+            ]
+        elif isinstance(awards, Mapping):
             award_iterable = [awards]
         elif isinstance(awards, Iterable) and not isinstance(awards, str | bytes):
             award_iterable = [entry for entry in awards if isinstance(entry, Mapping)]
         else:
             award_iterable = []
 
-        for award in award_iterable:
-            cur.execute(
-                """
-                INSERT INTO awards (
-                    opportunity_id, award_type, date, description, amount, vendor_name, vendor_duns
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+        insert_rows(
+            cur,
+            "awards",
+            _AWARD_COLUMNS,
+            [
                 (
                     opportunity_id,
                     award.get("type") or award.get("awardType"),
@@ -232,113 +475,168 @@ class IngestionOrchestrator:
                     award.get("vendorDuns")
                     or award.get("recipientDuns")
                     or award.get("recipientUniqueId"),
-                ),
-            )
+                )
+                for award in award_iterable
+            ],
+        )
 
     def _persist_contacts(
         self, cur, opportunity_id: int, contacts: Iterable[Mapping[str, object]]
     ) -> None:
-        cur.execute("DELETE FROM contacts WHERE opportunity_id = ?", (opportunity_id,))
-        for contact in contacts or []:
-            cur.execute(
-                """
-                INSERT INTO contacts (opportunity_id, name, type, email, phone)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+        insert_rows(
+            cur,
+            "contacts",
+            _CONTACT_COLUMNS,
+            [
                 (
                     opportunity_id,
                     contact.get("fullName"),
                     contact.get("type"),
                     contact.get("email"),
                     contact.get("phone"),
-                ),
+                )
+                for contact in contacts or []
+            ],
+        )
+
+    def prefetch(
+        self, records: Sequence[Mapping[str, object]]
+    ) -> list[PrefetchedRecord | None]:
+        """Fetch the attachments and description text ``records`` need from the network.
+
+        Returns one entry per record, or ``None`` for records that
+        :meth:`upsert_records` will not rewrite: unchanged digests and earlier copies of a
+        notice repeated in the batch. Callers run this before opening the write
+        transaction so network I/O never holds the SQLite write lock.
+        """
+
+        notice_ids = [str(record.get("noticeId")) for record in records]
+        with closing(self.database.connection.cursor()) as cur:
+            found = self._lookup_opportunities(cur, notice_ids)
+            _, latest = self._plan_writes(notice_ids, records, found)
+            stored = self._stored_attachments(
+                cur, [found[key][0] for key in latest if key in found]
             )
 
-    def _persist_description(
-        self, cur, opportunity_id: int, record: Mapping[str, object]
+        prefetched: list[PrefetchedRecord | None] = [None] * len(records)
+        remote: list[int] = []
+        for index in latest.values():
+            description = self._inline_description(records[index])
+            prefetched[index] = PrefetchedRecord(description=description)
+            if description is None and any(map(records[index].get, _DESCRIPTION_URL_KEYS)):
+                remote.append(index)
+
+        if not remote:
+            self._download_attachments(records, latest, found, stored, prefetched)
+            return prefetched
+        # Description pages are fetched on worker threads while the attachment downloads
+        # run on this one.
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(len(remote), self.config.download_concurrency)),
+            thread_name_prefix="samwatch-description",
+        ) as pool:
+            fetches = pool.map(self._fetch_description, [records[index] for index in remote])
+            self._download_attachments(records, latest, found, stored, prefetched)
+            for index, description in zip(remote, fetches, strict=True):
+                prefetched[index].description = description
+        return prefetched
+
+    def _download_attachments(
+        self,
+        records: Sequence[Mapping[str, object]],
+        latest: Mapping[str, int],
+        found: Mapping[str, tuple[int, object]],
+        stored: Mapping[tuple[int, str], tuple[str, str, int | None]],
+        prefetched: Sequence[PrefetchedRecord | None],
     ) -> None:
-        """Store the detailed description text when available."""
+        """Download the batch's attachments concurrently into ``prefetched``."""
 
-        description = self._extract_description(record)
-        if description is None:
-            return
-
-        cur.execute("DELETE FROM descriptions WHERE opportunity_id = ?", (opportunity_id,))
-        cur.execute(
-            """
-            INSERT INTO descriptions (opportunity_id, body)
-            VALUES (?, ?)
-            """,
-            (opportunity_id, description),
+        base_dir = self.config.files_dir
+        pending: list[tuple[int, str, Path, Mapping[str, object]]] = []
+        for notice_id, index in latest.items():
+            attachments = prefetched[index].attachments
+            opportunity_id = found.get(notice_id, (None,))[0]
+            notice_dir = None
+            for attachment in records[index].get("resourceLinks", []) or []:
+                url = attachment.get("url") or attachment.get("href")
+                if not url:
+                    continue
+
+                # Provider checksum unchanged and the file still on disk: keep the stored
+                # row instead of fetching the same bytes again.
+                sha256 = attachment.get("sha256")
+                previous = stored.get((opportunity_id, url))
+                if sha256 and previous and previous[0] == sha256:
+                    path = base_dir / previous[1]
+                    if path.is_file():
+                        kept = {"sha256": sha256, "size": previous[2]}
+                        attachments.append((url, path, kept, None))
+                        continue
+
+                filename = attachment.get("fileName")
+                if not filename:
+                    parsed = urlparse(url)
+                    filename = posixpath.basename(parsed.path.rstrip("/")) or "attachment"
+
+                if notice_dir is None:
+                    notice_dir = base_dir / _safe_path_component(notice_id)
+                    os.makedirs(notice_dir, exist_ok=True)
+                pending.append(
+                    (index, url, notice_dir / _safe_path_component(str(filename)), attachment)
+                )
+
+        results = self.client.download_attachments(
+            [(url, destination) for _, url, destination, _ in pending]
         )
+        for (index, url, destination, attachment), result in zip(pending, results, strict=True):
+            prefetched[index].attachments.append((url, destination, attachment, result))
 
     def _persist_attachments(
         self,
         cur,
         opportunity_id: int,
-        notice_id: str,
-        attachments: Iterable[Mapping[str, object]],
+        downloads: Iterable[_AttachmentResult],
     ) -> tuple[int, int]:
-        cur.execute("DELETE FROM attachments WHERE opportunity_id = ?", (opportunity_id,))
-        base_dir = self.config.files_dir
         downloaded = 0
         failed = 0
-        for attachment in attachments or []:
-            url = attachment.get("url") or attachment.get("href")
-            if not url:
-                continue
-
-            filename = attachment.get("fileName")
-            if not filename:
-                parsed = urlparse(url)
-                filename = Path(parsed.path).name or "attachment"
-
-            destination = base_dir / notice_id / filename
-            destination.parent.mkdir(parents=True, exist_ok=True)
-
+        rows: list[tuple[object, ...]] = []
+        for url, destination, attachment, download in downloads:
             sha256 = attachment.get("sha256")
             size = attachment.get("size")
-            try:
-                download = self.client.download_attachment(url, destination)
-            except SAMClientError as exc:
-                logger.warning("Failed to download attachment %s: %s", url, exc)
+            if download is None:
+                pass
+            elif isinstance(download, SAMClientError):
+                logger.warning("Failed to download attachment %s: %s", url, download)
                 failed += 1
-                download = None
-            except Exception:  # pragma: no cover - defensive guard
-                logger.exception("Unexpected error downloading attachment %s", url)
+            elif isinstance(download, BaseException):  # pragma: no cover - defensive guard
+                logger.error(
+                    "Unexpected error downloading attachment %s",
+                    url,
+                    exc_info=download,
+                )
                 failed += 1
-                download = None
             else:
                 sha256 = download.sha256
                 size = download.bytes_written
                 destination = download.path
                 downloaded += 1
 
-            local_path = self._relative_files_path(destination)
-            cur.execute(
-                """
-                INSERT INTO attachments (opportunity_id, url, local_path, sha256, bytes)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    opportunity_id,
-                    url,
-                    local_path,
-                    sha256,
-                    size,
-                ),
+            rows.append(
+                (opportunity_id, url, self._relative_files_path(destination), sha256, size)
             )
 
+        insert_rows(cur, "attachments", _ATTACHMENT_COLUMNS, rows)
         return downloaded, failed
 
-    def _extract_description(self, record: Mapping[str, object]) -> str | None:
+    @staticmethod
+    def _inline_description(record: Mapping[str, object]) -> str | None:
         body = record.get("description") or record.get("noticeDescription")
         if isinstance(body, dict):
             body = body.get("text")
-        if body:
-            return str(body)
+        return str(body) if body else None
 
-        for key in ("descriptionUrl", "descriptionLink", "noticeDescriptionUrl"):
+    def _fetch_description(self, record: Mapping[str, object]) -> str | None:
+        for key in _DESCRIPTION_URL_KEYS:
             url = record.get(key)
             if not url:
                 continue
@@ -352,7 +650,7 @@ class IngestionOrchestrator:
         return None
 
     def _relative_files_path(self, path: Path) -> str:
-        try:
-            return str(path.relative_to(self.config.files_dir))
-        except ValueError:
-            return str(path)
+        # A string prefix check; Path.relative_to builds several intermediate paths.
+        text = os.fspath(path)
+        prefix = os.path.join(self.config.files_dir, "")
+        return text[len(prefix) :] if text.startswith(prefix) else text
@@ -2,41 +2,148 @@
 
 from __future__ import annotations
 
+import re
+import sys
 import threading
 import time
-from typing import Any
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import NamedTuple
 
-from prometheus_client import Counter, Gauge, Info, start_http_server
+from prometheus_client import REGISTRY, CollectorRegistry, Counter, Gauge, Info, start_wsgi_server
+from prometheus_client.metrics_core import Metric
 
 from .scheduler import ScheduledJob
 
 
 class SchedulerMetricsRecorder:
-    """Interface for receiving scheduler lifecycle events."""
+    """Interface for receiving scheduler lifecycle events.
+
+    ``now`` is the Unix time of the event when the caller has already read the clock.
+    """
 
     def register_job(self, job: ScheduledJob) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
-    def record_job_start(self, job: ScheduledJob) -> None:  # pragma: no cover - interface
+    def register_jobs(self, jobs: Iterable[ScheduledJob]) -> None:
+        """Register several jobs at once; recorders may override to batch the work."""
+
+        for job in jobs:
+            self.register_job(job)
+
+    def record_job_start(
+        self, job: ScheduledJob, *, now: float | None = None
+    ) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
-    def record_job_success(self, job: ScheduledJob, duration: float) -> None:  # pragma: no cover
+    def record_job_success(
+        self, job: ScheduledJob, duration: float, *, now: float | None = None
+    ) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
     def record_job_failure(
-        self, job: ScheduledJob, duration: float, error: BaseException | None = None
+        self,
+        job: ScheduledJob,
+        duration: float,
+        error: BaseException | None = None,
+        *,
+        now: float | None = None,
     ) -> None:  # pragma: no cover - interface
         raise NotImplementedError
 
 
+# UUIDs, long hex tokens and numbers (notice ids, timestamps, ports) are masked in error
+# messages so a job's last_error does not become a new series for every failure.
+_ERROR_IDS = re.compile(
+    r"[0-9a-fA-F]{8}(?:-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}|[0-9a-fA-F]{8,}|\d+"
+)
+_MAX_ERROR_LENGTH = 120
+
+
+def _short_error(error: BaseException | None) -> str:
+    """Return the masked, truncated message exported for ``error``.
+
+    A plain single-argument exception already holds its message in ``args[0]``, so
+    ``str()`` is skipped; either way only a bounded prefix is masked, which keeps
+    exceptions carrying large payloads (response bodies) from being scanned in full.
+    """
+
+    if error is None:
+        return ""
+    args = error.args
+    if len(args) == 1 and isinstance(args[0], str) and type(error).__str__ is BaseException.__str__:
+        message = args[0]
+    else:
+        message = str(error)
+    return _ERROR_IDS.sub("<id>", message[: _MAX_ERROR_LENGTH * 2])[:_MAX_ERROR_LENGTH]
+
+
+@dataclass(slots=True)
+class JobMetricHandles:
+    """Labelled metric children for one job, resolved once at registration."""
+
+    started: Counter
+    succeeded: Counter
+    failed: Counter
+    last_started: Gauge
+    last_finished: Gauge
+    last_duration: Gauge
+    last_status: Gauge
+    last_error: Info
+    # Message currently exported by last_error, so unchanged values are not re-set.
+    error_message: str = ""
+
+
+class ExporterDetails(NamedTuple):
+    """Address and state of a :class:`PrometheusSchedulerMetrics` exporter."""
+
+    host: str
+    port: int
+    started: bool
+
+
+class _CachedRegistry:
+    """Serve a registry's metric families, collecting them at most once per ``ttl``.
+
+    Passed to prometheus_client's exporter in place of the registry, so gzip, OpenMetrics
+    negotiation and ``name[]`` filtering still come from the stock WSGI app. Filtered
+    scrapes bypass the cache.
+    """
+
+    def __init__(self, registry: CollectorRegistry, ttl: float) -> None:
+        self._registry = registry
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._metrics: list[Metric] = []
+        self._collected_at = float("-inf")
+
+    def collect(self) -> list[Metric]:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._collected_at >= self._ttl:
+                self._metrics = list(self._registry.collect())
+                self._collected_at = now
+            return self._metrics
+
+    def restricted_registry(self, names: Iterable[str]) -> object:
+        return self._registry.restricted_registry(names)
+
+
 class PrometheusSchedulerMetrics(SchedulerMetricsRecorder):
-    """Expose scheduler metrics via a Prometheus scrape endpoint."""
+    """Expose scheduler metrics via a Prometheus scrape endpoint.
 
-    def __init__(self, *, host: str = "0.0.0.0", port: int = 9464) -> None:
+    The collected metrics are cached for ``cache_ttl`` seconds, so frequent or concurrent
+    scrapes share one pass over the registry's collectors.
+    """
+
+    def __init__(
+        self, *, host: str = "0.0.0.0", port: int = 9464, cache_ttl: float = 1.0
+    ) -> None:
         self._host = host
         self._port = port
-        self._started = False
-        self._lock = threading.Lock()
+        self._details = ExporterDetails(host, port, False)
+        self._handles: dict[str, JobMetricHandles] = {}
+        self._registry = _CachedRegistry(REGISTRY, cache_ttl)
 
         self._runs_started = Counter(
             "samwatch_scheduler_runs_started_total",
@@ -80,59 +187,88 @@ class PrometheusSchedulerMetrics(SchedulerMetricsRecorder):
         )
 
     def start(self) -> None:
-        """Start the HTTP server if it has not already been started."""
+        """Start the HTTP server if it has not already been started.
 
-        with self._lock:
-            if not self._started:
-                start_http_server(self._port, addr=self._host)
-                self._started = True
+        Not thread-safe: call it once from the thread that bootstraps the service.
+        """
+
+        if self._details.started:
+            return
+        server, _ = start_wsgi_server(self._port, addr=self._host, registry=self._registry)
+        # Report the bound port, which differs from the configured one when that is 0.
+        self._details = self._details._replace(port=server.server_port, started=True)
 
     def register_job(self, job: ScheduledJob) -> None:
-        labels = {"job": job.name}
-        self._runs_started.labels(**labels)
-        self._runs_succeeded.labels(**labels)
-        self._runs_failed.labels(**labels)
-        self._last_started.labels(**labels).set(float("nan"))
-        self._last_finished.labels(**labels).set(float("nan"))
-        self._last_duration.labels(**labels).set(float("nan"))
-        self._last_status.labels(**labels).set(0.0)
-        self._last_error.labels(**labels).info({"message": ""})
-
-    def record_job_start(self, job: ScheduledJob) -> None:
-        labels = {"job": job.name}
-        now = time.time()
-        self._runs_started.labels(**labels).inc()
-        self._last_started.labels(**labels).set(now)
-        self._last_status.labels(**labels).set(0.0)
-
-    def record_job_success(self, job: ScheduledJob, duration: float) -> None:
-        labels = {"job": job.name}
-        now = time.time()
-        self._runs_succeeded.labels(**labels).inc()
-        self._last_finished.labels(**labels).set(now)
-        self._last_duration.labels(**labels).set(duration)
-        self._last_status.labels(**labels).set(1.0)
-        self._last_error.labels(**labels).info({"message": ""})
+        handles = self._register(job.name)
+        handles.last_started.set(float("nan"))
+        handles.last_finished.set(float("nan"))
+        handles.last_duration.set(float("nan"))
+        handles.last_status.set(0.0)
+        handles.last_error.info({"message": ""})
+
+    def _register(self, name: str) -> JobMetricHandles:
+        # Interned so handle lookups by job name usually compare by identity.
+        name = sys.intern(name)
+        handles = JobMetricHandles(
+            started=self._runs_started.labels(name),
+            succeeded=self._runs_succeeded.labels(name),
+            failed=self._runs_failed.labels(name),
+            last_started=self._last_started.labels(name),
+            last_finished=self._last_finished.labels(name),
+            last_duration=self._last_duration.labels(name),
+            last_status=self._last_status.labels(name),
+            last_error=self._last_error.labels(name),
+        )
+        self._handles[name] = handles
+        return handles
+
+    def _handles_for(self, job: ScheduledJob) -> JobMetricHandles:
+        handles = self._handles.get(job.name)
+        return handles if handles is not None else self._register(job.name)
+
+    def record_job_start(self, job: ScheduledJob, *, now: float | None = None) -> None:
+        handles = self._handles_for(job)
+        handles.started.inc()
+        handles.last_started.set(time.time() if now is None else now)
+        handles.last_status.set(0.0)
+
+    def record_job_success(
+        self, job: ScheduledJob, duration: float, *, now: float | None = None
+    ) -> None:
+        handles = self._handles_for(job)
+        handles.succeeded.inc()
+        handles.last_finished.set(time.time() if now is None else now)
+        handles.last_duration.set(duration)
+        handles.last_status.set(1.0)
+        self._set_last_error(handles, "")
 
     def record_job_failure(
-        self, job: ScheduledJob, duration: float, error: BaseException | None = None
+        self,
+        job: ScheduledJob,
+        duration: float,
+        error: BaseException | None = None,
+        *,
+        now: float | None = None,
     ) -> None:
-        labels = {"job": job.name}
-        now = time.time()
-        self._runs_failed.labels(**labels).inc()
-        self._last_finished.labels(**labels).set(now)
-        self._last_duration.labels(**labels).set(duration)
-        self._last_status.labels(**labels).set(-1.0)
-        message = str(error) if error else ""
-        self._last_error.labels(**labels).info({"message": message[:200]})
-
-    def metrics_details(self) -> dict[str, Any]:
-        """Return a snapshot of metric labels for inspection or testing."""
-
-        # Note: prometheus_client does not expose direct value access; this helper
-        # exists primarily so unit tests can assert that jobs have been registered.
-        return {
-            "host": self._host,
-            "port": self._port,
-            "started": self._started,
-        }
+        handles = self._handles_for(job)
+        handles.failed.inc()
+        handles.last_finished.set(time.time() if now is None else now)
+        handles.last_duration.set(duration)
+        handles.last_status.set(-1.0)
+        self._set_last_error(handles, _short_error(error))
+
+    @staticmethod
+    def _set_last_error(handles: JobMetricHandles, message: str) -> None:
+        if message != handles.error_message:
+            handles.last_error.info({"message": message})
+            handles.error_message = message
+
+    def metrics_details(self) -> ExporterDetails:
+        """Return the exporter's address and state for inspection or testing.
+
+        prometheus_client does not expose direct value access; this helper exists
+        primarily so unit tests can assert that the exporter was started. Use
+        ``._asdict()`` for a mapping.
+        """
+
+        return self._details
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -24,7 +23,8 @@ class Attachment:
     bytes: int | None = None
 
     def destination_path(self, base_dir: Path, notice_id: str) -> Path:
-        return base_dir / notice_id / self.filename
+        # One Path construction instead of an intermediate per ``/`` join.
+        return Path(base_dir, notice_id, self.filename)
 
 
 @dataclass(slots=True)
@@ -39,7 +39,7 @@ class Opportunity:
     posted_at: datetime | None = None
     updated_at: datetime | None = None
     response_deadline: datetime | None = None
-    naics_codes: Iterable[str] | None = None
+    naics_codes: tuple[str, ...] = ()
     set_aside: str | None = None
     digest: str | None = None
     contacts: list[Contact] = field(default_factory=list)
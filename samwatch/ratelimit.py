@@ -46,7 +46,8 @@ class RateLimiter:
         *,
         time_fn: callable[[], float] = time.monotonic,
     ) -> None:
-        self._lock = threading.Lock()
+        # Waiters in acquire() sleep on this until a window resets or new headers arrive.
+        self._cond = threading.Condition()
         self._time_fn = time_fn
         self.hourly = RateLimitBudget(limit=hourly_limit, remaining=hourly_limit)
         self.daily = (
@@ -54,45 +55,82 @@ class RateLimiter:
             if daily_limit is not None
             else None
         )
-        self._last_refresh = self._time_fn()
-
-    def _refresh(self) -> None:
         now = self._time_fn()
-        with self._lock:
-            elapsed = now - self._last_refresh
-            if elapsed >= 3600:
-                self.hourly.remaining = self.hourly.limit
-            if self.daily and elapsed >= 86400:
+        self._hourly_reset_at = now + 3600
+        self._daily_reset_at = now + 86400
+
+    def _refresh(self, now: float) -> None:
+        """Reset windows whose deadline has passed; the caller must hold ``_cond``.
+
+        The two windows reset independently, so the daily budget is restored even when
+        the hourly window reset in between.
+        """
+
+        if now >= self._hourly_reset_at:
+            self.hourly.remaining = self.hourly.limit
+            self._hourly_reset_at = now + 3600
+        if now >= self._daily_reset_at:
+            if self.daily:
                 self.daily.remaining = self.daily.limit
-            if elapsed >= 3600 or (self.daily and elapsed >= 86400):
-                self._last_refresh = now
+            self._daily_reset_at = now + 86400
+
+    def next_reset_at(self) -> float:
+        """Return the ``time_fn`` time at which the next budget window resets."""
+
+        if self.daily is None:
+            return self._hourly_reset_at
+        return min(self._hourly_reset_at, self._daily_reset_at)
 
     def acquire(self, tokens: int = 1, block: bool = True, timeout: float | None = None) -> bool:
-        """Acquire tokens from the rate limiter."""
+        """Acquire tokens from the rate limiter.
+
+        Blocked callers sleep until a budget window resets, the timeout expires or
+        :meth:`update_from_headers` reports new capacity, rather than polling.
+        """
 
         deadline = None if timeout is None else self._time_fn() + timeout
-        while True:
-            self._refresh()
-            with self._lock:
+        with self._cond:
+            while True:
+                now = self._time_fn()
+                self._refresh(now)
+                daily = self.daily
                 if self.hourly.remaining >= tokens and (
-                    self.daily is None or self.daily.remaining >= tokens
+                    daily is None or daily.remaining >= tokens
                 ):
                     self.hourly.remaining -= tokens
-                    if self.daily:
-                        self.daily.remaining -= tokens
+                    if daily:
+                        daily.remaining -= tokens
                     return True
 
-                if not block:
+                if not block or (deadline is not None and now >= deadline):
                     return False
+                wake_at = self.next_reset_at()
+                if deadline is not None:
+                    wake_at = min(wake_at, deadline)
+                self._cond.wait(max(wake_at - now, 0.0))
+
+    def reserve(self, tokens: int) -> int:
+        """Take up to ``tokens`` tokens without blocking; return how many were granted.
 
-            if deadline is not None and self._time_fn() >= deadline:
-                return False
-            time.sleep(1)
+        Lets a caller with a batch of requests pay for as many as the budgets allow under
+        one lock acquisition, falling back to :meth:`acquire` for the remainder.
+        """
+
+        with self._cond:
+            self._refresh(self._time_fn())
+            granted = min(tokens, self.hourly.remaining)
+            if self.daily:
+                granted = min(granted, self.daily.remaining)
+            granted = max(granted, 0)
+            self.hourly.remaining -= granted
+            if self.daily:
+                self.daily.remaining -= granted
+            return granted
 
     def update_from_headers(self, headers: Mapping[str, str]) -> None:
         """Update rate limit budgets based on response headers."""
 
-        with self._lock:
+        with self._cond:
             self.hourly.update_from_headers(
                 headers,
                 limit_header="X-RateLimit-Limit",
@@ -106,6 +144,7 @@ class RateLimiter:
                     remaining_header="X-RateLimit-Remaining-Day",
                     reset_header="X-RateLimit-Reset-Day",
                 )
+            self._cond.notify_all()
 
     def record_retry_after(self, retry_after: float | None) -> None:
         """Sleep according to ``Retry-After`` header guidance."""
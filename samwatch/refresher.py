@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
+from itertools import islice
+from typing import Any
 
 from .client import SAMWatchClient
 from .config import Config
@@ -23,21 +27,43 @@ class Refresher:
         self._ingestor = IngestionOrchestrator(config, client, database)
 
     def refresh_opportunity(self, notice_id: str) -> None:
+        self.refresh_opportunities([notice_id])
+
+    def refresh_opportunities(self, notice_ids: Iterable[str]) -> None:
+        """Re-fetch ``notice_ids`` concurrently and store them in one write batch.
+
+        Lookups run on up to ``search_workers`` threads; the shared rate limiter still
+        paces the requests.
+        """
+
+        notice_ids = list(dict.fromkeys(notice_ids))
+        if not notice_ids:
+            return
+        workers = max(1, min(len(notice_ids), self.config.search_workers))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="samwatch-refresh") as pool:
+            records = [record for record in pool.map(self._fetch_notice, notice_ids) if record]
+        if records:
+            self._ingestor.write_batch(records)
+
+    def _fetch_notice(self, notice_id: str) -> dict[str, Any] | None:
         logger.info("Refreshing opportunity %s", notice_id)
         data = self.client.search_opportunities({"noticeId": notice_id, "limit": 1})
         records = data.get("opportunitiesData", [])
         if not records:
             logger.warning("No data returned for notice %s", notice_id)
-            return
-        record = records[0]
-        self._ingestor.upsert_record(record)
+            return None
+        return records[0]
 
     def refresh_recent(self, hours: int = 24) -> None:
         window_start = datetime.now(UTC) - timedelta(hours=hours)
-        iso_start = window_start.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        iso_start = window_start.strftime("%Y-%m-%dT%H:%M:%SZ")
         logger.info("Refreshing opportunities changed since %s", iso_start)
-        data = self.client.search_opportunities({"modifiedFrom": iso_start})
-        for record in data.get("opportunitiesData", []):
-            notice_id = record.get("noticeId")
-            if notice_id:
-                self._ingestor.upsert_record(record)
+        records = (
+            record
+            for record in self.client.iter_search({"modifiedFrom": iso_start})
+            if record.get("noticeId")
+        )
+        # One transaction per page of results rather than one per record.
+        page_size = min(self.config.search_limit, 1000)
+        while page := list(islice(records, page_size)):
+            self._ingestor.write_batch(page)
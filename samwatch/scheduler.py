@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import threading
 import time
-from collections.abc import Callable
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, TYPE_CHECKING
 
@@ -15,6 +17,9 @@ if TYPE_CHECKING:  # pragma: no cover - type checking only
 
 logger = logging.getLogger(__name__)
 
+# How long run() waits before re-checking when no jobs are scheduled.
+_IDLE_WAIT_SECONDS = 60.0
+
 
 @dataclass(slots=True)
 class ScheduledJob:
@@ -27,7 +32,11 @@ class ScheduledJob:
 
 @dataclass(slots=True)
 class JobMetrics:
-    """Runtime metrics tracked for each scheduled job."""
+    """Runtime metrics tracked for each scheduled job.
+
+    :meth:`to_dict` serves a copy of the snapshot taken by the last :meth:`publish`, so
+    snapshots do not re-format timestamps between job runs.
+    """
 
     runs_started: int = 0
     runs_succeeded: int = 0
@@ -35,8 +44,20 @@ class JobMetrics:
     last_started_at: datetime | None = None
     last_finished_at: datetime | None = None
     last_error: str | None = None
+    _snapshot: dict[str, Any] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.publish()
+
+    def publish(self) -> None:
+        """Rebuild the serialized snapshot after the fields have been updated."""
+
+        self._snapshot = self._build_dict()
 
     def to_dict(self) -> dict[str, Any]:
+        return dict(self._snapshot)
+
+    def _build_dict(self) -> dict[str, Any]:
         return {
             "runs_started": self.runs_started,
             "runs_succeeded": self.runs_succeeded,
@@ -56,60 +77,105 @@ class Scheduler:
 
     def __init__(self, metrics_recorder: "SchedulerMetricsRecorder | None" = None) -> None:
         self._jobs: list[ScheduledJob] = []
+        # (next due time on the monotonic clock, tiebreaker, job), ordered by due time.
+        self._heap: list[tuple[float, int, ScheduledJob]] = []
+        self._sequence = itertools.count()
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
+        # Set to make run() re-check the heap, e.g. after add_job or stop.
+        self._wake = threading.Event()
         self._metrics: dict[str, JobMetrics] = {}
         self._metrics_recorder = metrics_recorder
 
     def add_job(self, job: ScheduledJob) -> None:
+        self.add_jobs([job])
+
+    def add_jobs(self, jobs: Iterable[ScheduledJob]) -> None:
+        """Schedule ``jobs`` under one lock and register them with the recorder in one call."""
+
+        jobs = list(jobs)
+        if not jobs:
+            return
         with self._lock:
-            self._jobs.append(job)
-            self._metrics.setdefault(job.name, JobMetrics())
-            logger.info("Scheduled job %s to run every %s", job.name, job.interval)
+            now = time.monotonic()
+            for job in jobs:
+                self._jobs.append(job)
+                heapq.heappush(self._heap, (now, next(self._sequence), job))
+                self._metrics.setdefault(job.name, JobMetrics())
+                logger.info("Scheduled job %s to run every %s", job.name, job.interval)
             if self._metrics_recorder is not None:
-                self._metrics_recorder.register_job(job)
+                self._metrics_recorder.register_jobs(jobs)
+        self._wake.set()
 
     def run(self) -> None:
-        """Run scheduled jobs until stopped."""
+        """Run scheduled jobs until stopped.
+
+        The thread sleeps until the earliest job is due instead of polling every job once
+        a second.
+        """
 
-        next_run: dict[str, float] = {}
         while not self._stop_event.is_set():
-            now = time.monotonic()
             with self._lock:
-                jobs = list(self._jobs)
-            for job in jobs:
-                due_at = next_run.get(job.name, now)
-                if now >= due_at:
-                    logger.debug("Executing job %s", job.name)
-                    metrics = self._metrics.setdefault(job.name, JobMetrics())
-                    metrics.runs_started += 1
-                    metrics.last_started_at = datetime.now(UTC)
-                    start_time = time.monotonic()
-                    if self._metrics_recorder is not None:
-                        self._metrics_recorder.record_job_start(job)
-                    try:
-                        job.action()
-                    except Exception as exc:  # pragma: no cover - defensive logging
-                        logger.exception("Job %s raised an exception", job.name)
-                        metrics.runs_failed += 1
-                        metrics.last_error = "exception"
-                        if self._metrics_recorder is not None:
-                            duration = time.monotonic() - start_time
-                            self._metrics_recorder.record_job_failure(job, duration, exc)
-                    else:
-                        metrics.runs_succeeded += 1
-                        metrics.last_error = None
-                        if self._metrics_recorder is not None:
-                            duration = time.monotonic() - start_time
-                            self._metrics_recorder.record_job_success(job, duration)
-                    finally:
-                        metrics.last_finished_at = datetime.now(UTC)
-                        next_run[job.name] = now + job.interval.total_seconds()
-            time.sleep(1)
+                if self._heap:
+                    due_at, _, job = self._heap[0]
+                    delay = due_at - time.monotonic()
+                    if delay <= 0:
+                        heapq.heappop(self._heap)
+                else:
+                    job, delay = None, _IDLE_WAIT_SECONDS
+            if job is None or delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue
+
+            started = self._run_job(job)
+            with self._lock:
+                heapq.heappush(
+                    self._heap,
+                    (started + job.interval.total_seconds(), next(self._sequence), job),
+                )
+
+    def _run_job(self, job: ScheduledJob) -> float:
+        """Execute ``job`` once, recording metrics; returns its monotonic start time."""
+
+        logger.debug("Executing job %s", job.name)
+        # Read each clock once per boundary; wall times are derived from the start.
+        start_time = time.monotonic()
+        started_at = datetime.now(UTC)
+        started_epoch = started_at.timestamp()
+        metrics = self._metrics.setdefault(job.name, JobMetrics())
+        metrics.runs_started += 1
+        metrics.last_started_at = started_at
+        metrics.publish()
+        recorder = self._metrics_recorder
+        if recorder is not None:
+            recorder.record_job_start(job, now=started_epoch)
+        try:
+            job.action()
+        except Exception as exc:  # pragma: no cover - defensive logging
+            duration = time.monotonic() - start_time
+            logger.exception("Job %s raised an exception", job.name)
+            metrics.runs_failed += 1
+            metrics.last_error = "exception"
+            if recorder is not None:
+                recorder.record_job_failure(job, duration, exc, now=started_epoch + duration)
+        else:
+            duration = time.monotonic() - start_time
+            metrics.runs_succeeded += 1
+            metrics.last_error = None
+            if recorder is not None:
+                recorder.record_job_success(job, duration, now=started_epoch + duration)
+        metrics.last_finished_at = started_at + timedelta(seconds=duration)
+        metrics.publish()
+        return start_time
 
     def stop(self) -> None:
         self._stop_event.set()
+        self._wake.set()
 
     def metrics_snapshot(self) -> dict[str, dict[str, Any]]:
+        # Only the dict copy needs the lock; JobMetrics fields are written solely by the
+        # run() thread, so they can be read afterwards without holding it.
         with self._lock:
-            return {name: metrics.to_dict() for name, metrics in self._metrics.items()}
+            items = list(self._metrics.items())
+        return {name: metrics.to_dict() for name, metrics in items}
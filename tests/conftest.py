@@ -1,6 +1,54 @@
+import os
+import shutil
 import sys
+import tempfile
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+
+from samwatch.db import Database  # noqa: E402
+
+# Memory-backed on Linux, so the SQLite WAL and attachment writes of the ingestion tests
+# never wait on a real disk.
+_SHM = Path("/dev/shm")
+
+
+@pytest.fixture()
+def tmp_path(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    if not (_SHM.is_dir() and os.access(_SHM, os.W_OK)):
+        yield tmp_path_factory.mktemp("test", numbered=True)
+        return
+    path = Path(tempfile.mkdtemp(prefix="samwatch-test-", dir=_SHM))
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the schema once per session; tests start from a copy of this file."""
+
+    path = tmp_path_factory.mktemp("schema") / "template.db"
+    db = Database(path)
+    db.initialize_schema()
+    # Closing the last connection checkpoints the WAL, so the main file is complete.
+    db.close()
+    return path
+
+
+@pytest.fixture()
+def schema_database(schema_template: Path) -> Callable[[Path], Database]:
+    """Return a factory that opens a fresh database at ``path`` with the schema in place."""
+
+    def create(path: Path) -> Database:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(schema_template, path)
+        return Database(path)
+
+    return create
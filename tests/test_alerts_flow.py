@@ -1,3 +1,6 @@
+import sqlite3
+from collections.abc import Callable
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -23,9 +26,10 @@ def temp_config(tmp_path: Path) -> Config:
 
 
 @pytest.fixture()
-def database(temp_config: Config) -> Database:
-    db = Database(temp_config.sqlite_path)
-    db.initialize_schema()
+def database(
+    temp_config: Config, schema_database: Callable[[Path], Database]
+) -> Database:
+    db = schema_database(temp_config.sqlite_path)
     with db.cursor() as cur:
         cur.execute(
             """
@@ -96,3 +100,225 @@ def test_alert_engine_persists_and_reuses_matches(temp_config: Config, database:
         cur.execute("SELECT COUNT(*) FROM alerts WHERE rule_id = ?", (rule_id,))
         assert cur.fetchone()[0] == 1
 
+
+
+def test_alert_engine_evaluates_json_rules(temp_config: Config, database: Database) -> None:
+    engine = AlertEngine(temp_config, database)
+
+    with database.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO rules (name, kind, definition, is_active)
+            VALUES (?, ?, ?, 1)
+            """,
+            (
+                "JSON Rule",
+                "json",
+                '{"terms": [{"field": "title", "value": "Opportunity"},'
+                ' {"field": "agency", "value": "test"}]}',
+            ),
+        )
+        matching_rule_id = cur.lastrowid
+        cur.execute(
+            """
+            INSERT INTO rules (name, kind, definition, is_active)
+            VALUES (?, ?, ?, 1)
+            """,
+            (
+                "Non-matching JSON Rule",
+                "json",
+                '{"terms": [{"field": "title", "value": "Bridge"}]}',
+            ),
+        )
+        cur.execute(
+            """
+            INSERT INTO rules (name, kind, definition, is_active)
+            VALUES (?, ?, ?, 1)
+            """,
+            (
+                "Injected JSON Rule",
+                "json",
+                '{"terms": [{"field": "1=1 OR title", "value": "x"}]}',
+            ),
+        )
+
+    engine.evaluate_rules()
+
+    with database.cursor() as cur:
+        cur.execute("SELECT rule_id, opportunity_id FROM rule_matches")
+        rows = [tuple(row) for row in cur.fetchall()]
+    assert rows == [(matching_rule_id, 1)]
+
+
+def test_json_rule_underscores_match_literally(temp_config: Config, database: Database) -> None:
+    database.execute("UPDATE opportunities SET set_aside = 'SB_A'")
+    with database.cursor() as cur:
+        # Values under three characters use the LIKE fallback, the rest the trigram index.
+        for value in ("B_", "S_", "B_A", "S_A"):
+            cur.execute(
+                "INSERT INTO rules (name, kind, definition) VALUES (?, ?, ?)",
+                (value, "json", f'{{"terms": [{{"field": "set_aside", "value": "{value}"}}]}}'),
+            )
+
+    AlertEngine(temp_config, database).evaluate_rules()
+
+    with database.cursor() as cur:
+        cur.execute(
+            "SELECT r.name FROM rule_matches m JOIN rules r ON r.id = m.rule_id ORDER BY r.id"
+        )
+        assert [row[0] for row in cur.fetchall()] == ["B_", "B_A"]
+
+
+def test_alert_engine_reloads_rules_after_edits(temp_config: Config, database: Database) -> None:
+    engine = AlertEngine(temp_config, database)
+    engine.evaluate_rules()
+
+    with database.cursor() as cur:
+        cur.execute(
+            "INSERT INTO rules (name, kind, definition) VALUES (?, ?, ?)",
+            ("Late Rule", "sql", "SELECT id AS opportunity_id FROM opportunities"),
+        )
+        rule_id = cur.lastrowid
+    engine.evaluate_rules()
+
+    with database.cursor() as cur:
+        cur.execute("SELECT rule_id FROM rule_matches")
+        assert [row[0] for row in cur.fetchall()] == [rule_id]
+
+
+def test_alert_engine_notifies_only_new_matches(
+    temp_config: Config, database: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = AlertEngine(temp_config, database)
+    notified: list[str] = []
+    monkeypatch.setattr(
+        engine,
+        "_send_notification",
+        lambda destination, rule_name, entries, context: notified.extend(
+            entry["payload"]["title"] for entry in entries
+        ),
+    )
+    with database.cursor() as cur:
+        cur.execute(
+            "INSERT INTO rules (name, kind, definition) VALUES (?, ?, ?)",
+            ("Titles", "sql", "SELECT id AS opportunity_id, title FROM opportunities"),
+        )
+        cur.execute(
+            "INSERT INTO alerts (rule_id, delivery_method, target) VALUES (?, ?, ?)",
+            (cur.lastrowid, "cli", "{}"),
+        )
+
+    engine.evaluate_rules()
+    engine.evaluate_rules()
+    assert notified == ["Test Opportunity"]
+
+    database.execute("UPDATE opportunities SET title = 'Amended Opportunity'")
+    engine.evaluate_rules()
+    assert notified == ["Test Opportunity"]
+    with database.cursor() as cur:
+        cur.execute("SELECT payload FROM rule_matches")
+        assert "Amended Opportunity" in cur.fetchone()[0]
+
+
+def test_alert_engine_opens_one_reader_per_worker(
+    temp_config: Config, database: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    config = replace(temp_config, rule_workers=2)
+    opened: list[object] = []
+    open_reader = database.open_reader
+
+    def tracking_open_reader():
+        conn = open_reader()
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(database, "open_reader", tracking_open_reader)
+    with database.cursor() as cur:
+        for index in range(6):
+            cur.execute(
+                "INSERT INTO rules (name, kind, definition) VALUES (?, ?, ?)",
+                (f"Rule {index}", "sql", "SELECT id AS opportunity_id FROM opportunities"),
+            )
+
+    AlertEngine(config, database).evaluate_rules()
+
+    assert 1 <= len(opened) <= 2
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    with database.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM rule_matches")
+        assert cur.fetchone()[0] == 6
+
+
+def test_alert_engine_queries_rules_without_write_lock(
+    temp_config: Config, database: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    engine = AlertEngine(temp_config, database)
+    evaluate_rule = engine._evaluate_rule
+
+    def evaluate_while_writing(rule):
+        # Fails with "database is locked" if the pass already holds the write lock.
+        writer = sqlite3.connect(database.path, timeout=0, isolation_level=None)
+        try:
+            writer.execute("BEGIN IMMEDIATE")
+            writer.execute("ROLLBACK")
+        finally:
+            writer.close()
+        return evaluate_rule(rule)
+
+    monkeypatch.setattr(engine, "_evaluate_rule", evaluate_while_writing)
+    with database.cursor() as cur:
+        cur.execute(
+            "INSERT INTO rules (name, kind, definition) VALUES (?, ?, ?)",
+            ("All", "sql", "SELECT id AS opportunity_id FROM opportunities"),
+        )
+
+    engine.evaluate_rules()
+
+    with database.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM rule_matches")
+        assert cur.fetchone()[0] == 1
+
+
+def test_alert_engine_reuses_smtp_connections(
+    temp_config: Config, database: Database, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sent: list[str] = []
+    connections: list[object] = []
+
+    class FakeSMTP:
+        def __init__(self, host: str, port: int, timeout: float) -> None:
+            connections.append(self)
+
+        def send_message(self, message) -> None:
+            sent.append(message["Subject"])
+
+        def quit(self) -> None:
+            pass
+
+        def close(self) -> None:
+            pass
+
+    monkeypatch.setattr("samwatch.alerts.smtplib.SMTP", FakeSMTP)
+    target = (
+        '{"smtp_server": "smtp.example.com", "sender": "samwatch@example.com",'
+        ' "recipients": ["alerts@example.com"]}'
+    )
+    with database.cursor() as cur:
+        for name in ("First", "Second"):
+            cur.execute(
+                "INSERT INTO rules (name, kind, definition) VALUES (?, ?, ?)",
+                (name, "sql", "SELECT id AS opportunity_id FROM opportunities"),
+            )
+            cur.execute(
+                "INSERT INTO alerts (rule_id, delivery_method, target) VALUES (?, ?, ?)",
+                (cur.lastrowid, "email", target),
+            )
+
+    engine = AlertEngine(temp_config, database)
+    engine.evaluate_rules()
+    engine.close()
+
+    assert sorted(sent) == ["SAMWatch matches for First", "SAMWatch matches for Second"]
+    assert len(connections) == 1
@@ -0,0 +1,68 @@
+from dataclasses import fields
+from pathlib import Path
+
+import pytest
+
+from samwatch.config import Config
+
+
+def test_from_env_applies_field_defaults(tmp_path: Path) -> None:
+    config = Config.from_env(
+        {"SAM_API_KEY": "test-key", "SAMWATCH_DATA_DIR": str(tmp_path / "data")}
+    )
+
+    assert config.base_url == "https://api.sam.gov/opportunities/v2"
+    assert config.search_limit == 100
+    assert config.rule_workers == 4
+    assert config.sqlite_path == tmp_path / "data" / "sqlite" / "samwatch.db"
+    assert config.files_dir.is_dir()
+
+
+def test_from_env_reads_every_variable(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    values = {
+        "SAM_API_KEY": ("api_key", "env-key", "env-key"),
+        "SAMWATCH_DATA_DIR": ("data_dir", str(tmp_path / "env"), tmp_path / "env"),
+        "SAMWATCH_SQLITE_PATH": ("sqlite_path", str(tmp_path / "app.db"), tmp_path / "app.db"),
+        "SAMWATCH_SQLITE_DURABLE": ("sqlite_durable", "yes", True),
+        "SAMWATCH_FILES_DIR": ("files_dir", str(tmp_path / "files"), tmp_path / "files"),
+        "SAMWATCH_BASE_URL": ("base_url", "https://example.com/v2", "https://example.com/v2"),
+        "SAMWATCH_SEARCH_LIMIT": ("search_limit", "250", 250),
+        "SAMWATCH_SEARCH_WORKERS": ("search_workers", "2", 2),
+        "SAMWATCH_DOWNLOAD_CONCURRENCY": ("download_concurrency", "3", 3),
+        "SAMWATCH_ATTACHMENT_DROP_CACHE": ("attachment_drop_cache", "true", True),
+        "SAMWATCH_HOURLY_CAP": ("hourly_request_cap", "50", 50),
+        "SAMWATCH_DAILY_CAP": ("daily_request_cap", "500", 500),
+        "SAMWATCH_HTTP_TIMEOUT": ("http_timeout", "5.5", 5.5),
+        "SAMWATCH_HOT_FREQUENCY": ("hot_frequency_minutes", "5", 5),
+        "SAMWATCH_WARM_FREQUENCY": ("warm_frequency_minutes", "30", 30),
+        "SAMWATCH_COLD_FREQUENCY": ("cold_frequency_hours", "24", 24),
+        "SAMWATCH_ALERT_RETRY_ATTEMPTS": ("alert_retry_attempts", "7", 7),
+        "SAMWATCH_ALERT_RETRY_BACKOFF": ("alert_retry_backoff_seconds", "0.5", 0.5),
+        "SAMWATCH_RULE_WORKERS": ("rule_workers", "9", 9),
+        "SAMWATCH_ALERT_RICH_OUTPUT": ("alert_rich_output", "off", False),
+        "SAMWATCH_METRICS_ENABLED": ("metrics_enabled", "0", False),
+        "SAMWATCH_METRICS_HOST": ("metrics_host", "127.0.0.1", "127.0.0.1"),
+        "SAMWATCH_METRICS_PORT": ("metrics_port", "9999", 9999),
+        "SAMWATCH_METRICS_CACHE_TTL": ("metrics_cache_ttl", "2.5", 2.5),
+    }
+    for key, (_, raw, _) in values.items():
+        monkeypatch.setenv(key, raw)
+
+    config = Config.from_env()
+
+    assert {name: getattr(config, name) for name, _, _ in values.values()} == {
+        name: expected for name, _, expected in values.values()
+    }
+    # Every setting must be reachable from the environment.
+    assert {name for name, _, _ in values.values()} == {
+        item.name for item in fields(Config) if item.init
+    }
+
+
+def test_ensure_directories_recreates_removed_directories(tmp_path: Path) -> None:
+    config = Config.from_env({"SAM_API_KEY": "test-key", "SAMWATCH_DATA_DIR": str(tmp_path)})
+    config.files_dir.rmdir()
+
+    config.ensure_directories()
+
+    assert config.files_dir.is_dir()
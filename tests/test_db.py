@@ -0,0 +1,51 @@
+import shutil
+import sqlite3
+from pathlib import Path
+
+from samwatch.db import Database
+
+
+def _autocheckpoint(db: Database) -> int:
+    return db.connection.execute("PRAGMA wal_autocheckpoint").fetchone()[0]
+
+
+def test_wal_autocheckpoint_follows_existing_page_size(tmp_path: Path) -> None:
+    path = tmp_path / "legacy.db"
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA page_size = 4096")
+    conn.execute("CREATE TABLE t (x)")
+    conn.close()
+
+    db = Database(path)
+    try:
+        assert db.connection.execute("PRAGMA page_size").fetchone()[0] == 4096
+        assert _autocheckpoint(db) == 2048
+        db.tune_for_ingest()
+        assert _autocheckpoint(db) == 10240
+    finally:
+        db.close()
+
+
+def test_new_database_uses_large_pages(tmp_path: Path) -> None:
+    db = Database(tmp_path / "new.db")
+    try:
+        db.initialize_schema()
+        assert db.connection.execute("PRAGMA page_size").fetchone()[0] == 16384
+        assert _autocheckpoint(db) == 512
+    finally:
+        db.close()
+
+
+def test_connect_recreates_removed_parent_directory(tmp_path: Path) -> None:
+    path = tmp_path / "sqlite" / "samwatch.db"
+    first = Database(path)
+    first.connect()
+    first.close()
+    shutil.rmtree(path.parent)
+
+    db = Database(path)
+    try:
+        db.connect()
+        assert path.exists()
+    finally:
+        db.close()
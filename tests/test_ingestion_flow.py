@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -73,6 +74,9 @@ class StubClient:
             bytes_written=len(payload),
         )
 
+    def download_attachments(self, downloads):
+        return [self.download_attachment(url, destination) for url, destination in downloads]
+
     def fetch_description(self, url: str) -> str:
         return "Fetched description from URL"
 
@@ -93,9 +97,10 @@ def temp_config(tmp_path: Path) -> Config:
 
 
 @pytest.fixture()
-def database(temp_config: Config) -> Database:
-    db = Database(temp_config.sqlite_path)
-    db.initialize_schema()
+def database(
+    temp_config: Config, schema_database: Callable[[Path], Database]
+) -> Database:
+    db = schema_database(temp_config.sqlite_path)
     yield db
     db.close()
 
@@ -116,6 +121,9 @@ def test_hot_ingestion_records_data(temp_config: Config, database: Database) ->
         assert row["naics_codes"] == "541330"
         assert row["set_aside"] == "none"
 
+        cur.execute("SELECT code FROM opportunity_naics")
+        assert [code for (code,) in cur.fetchall()] == ["541330"]
+
         cur.execute("SELECT COUNT(*) FROM awards")
         assert cur.fetchone()[0] == 1
 
@@ -126,6 +134,11 @@ def test_hot_ingestion_records_data(temp_config: Config, database: Database) ->
         description = cur.fetchone()[0]
         assert "Detailed body" in description
 
+        cur.execute(
+            "SELECT rowid FROM opportunity_search WHERE opportunity_search MATCH 'detailed'"
+        )
+        assert cur.fetchone() is not None
+
         cur.execute("SELECT url, local_path, sha256, bytes FROM attachments")
         attachment = cur.fetchone()
         assert attachment["url"].endswith("spec.pdf")
@@ -144,6 +157,18 @@ def test_hot_ingestion_records_data(temp_config: Config, database: Database) ->
     assert stored_files, "attachment should be written to disk"
 
 
+def test_upsert_record_indexes_description(temp_config: Config, database: Database) -> None:
+    orchestrator = IngestionOrchestrator(temp_config, StubClient(), database)
+
+    outcome = orchestrator.upsert_record(StubClient().records[0])
+
+    with database.cursor() as cur:
+        cur.execute(
+            "SELECT rowid FROM opportunity_search WHERE opportunity_search MATCH 'detailed'"
+        )
+        assert cur.fetchone()[0] == outcome.opportunity_id
+
+
 def test_hot_ingestion_upserts_updates(temp_config: Config, database: Database) -> None:
     client = StubClient()
     orchestrator = IngestionOrchestrator(temp_config, client, database)
@@ -164,3 +189,40 @@ def test_hot_ingestion_upserts_updates(temp_config: Config, database: Database)
         assert updated_count >= 1
 
     assert len(client.download_calls) >= 2
+
+
+def test_hot_ingestion_skips_unchanged_records(temp_config: Config, database: Database) -> None:
+    client = StubClient()
+    orchestrator = IngestionOrchestrator(temp_config, client, database)
+
+    orchestrator.run_hot()
+    orchestrator.run_hot()
+
+    assert len(client.download_calls) == 1
+    with database.cursor() as cur:
+        cur.execute("SELECT COUNT(*) FROM attachments")
+        assert cur.fetchone()[0] == 1
+        cur.execute(
+            "SELECT value FROM run_metrics WHERE metric = 'records_updated' ORDER BY id DESC"
+        )
+        assert cur.fetchone()[0] == 0
+
+
+def test_changed_record_keeps_attachments_with_matching_checksum(
+    temp_config: Config, database: Database
+) -> None:
+    client = StubClient()
+    client.records[0]["resourceLinks"][0]["sha256"] = "stub-sha"
+    orchestrator = IngestionOrchestrator(temp_config, client, database)
+
+    orchestrator.run_hot()
+    client.records[0]["digest"] = "digest-2"
+    orchestrator.run_hot()
+
+    assert len(client.download_calls) == 1
+    with database.cursor() as cur:
+        cur.execute("SELECT local_path, sha256, bytes FROM attachments")
+        attachment = cur.fetchone()
+        assert attachment["local_path"] == "TEST123/spec.pdf"
+        assert attachment["sha256"] == "stub-sha"
+        assert attachment["bytes"] == len(b"attachment-bytes")
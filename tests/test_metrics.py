@@ -0,0 +1,41 @@
+from datetime import timedelta
+
+import httpx
+
+from samwatch.metrics import PrometheusSchedulerMetrics
+from samwatch.scheduler import ScheduledJob
+
+
+def test_metrics_endpoint_serves_stock_exposition() -> None:
+    # Metric names are registered on the global registry, so only one exporter per process.
+    exporter = PrometheusSchedulerMetrics(host="127.0.0.1", port=0, cache_ttl=60.0)
+    exporter.start()
+    job = ScheduledJob("hot", timedelta(minutes=15), lambda: None)
+    exporter.record_job_start(job, now=1.0)
+    url = f"http://127.0.0.1:{exporter.metrics_details().port}/metrics"
+
+    with httpx.Client() as client:
+        plain = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert plain.status_code == 200
+        assert plain.headers["Content-Type"].startswith("text/plain")
+        assert 'samwatch_scheduler_runs_started_total{job="hot"} 1.0' in plain.text
+
+        # Served from the cache until the TTL expires.
+        exporter.record_job_start(job, now=2.0)
+        cached = client.get(url, headers={"Accept-Encoding": "identity"})
+        assert 'samwatch_scheduler_runs_started_total{job="hot"} 1.0' in cached.text
+
+        compressed = client.get(url, headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert "samwatch_scheduler_runs_started_total" in compressed.text
+
+        openmetrics = client.get(url, headers={"Accept": "application/openmetrics-text"})
+        assert openmetrics.headers["Content-Type"].startswith("application/openmetrics-text")
+        assert openmetrics.text.endswith("# EOF\n")
+
+        filtered = client.get(
+            url, params={"name[]": "samwatch_scheduler_runs_started_total"}
+        )
+        assert 'samwatch_scheduler_runs_started_total{job="hot"} 2.0' in filtered.text
+        assert "samwatch_scheduler_last_status" not in filtered.text
+